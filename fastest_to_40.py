@@ -8,10 +8,12 @@ A Python script to find the optimal 40-card Kano deck using RL.
 import json
 import pandas as pd
 import numpy as np
-import random
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from collections import defaultdict
+from datetime import datetime
+from functools import partial
+import multiprocessing as mp
 import os
 
 # Gymnasium imports
@@ -22,7 +24,20 @@ from gymnasium import spaces
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.distributions import Categorical
+
+# Numba is optional (pip install .[fast]): without it the rollout kernel runs
+# as plain Python. With it the kernel is compiled on its first call, not at
+# import, and cache=True stores the machine code in __pycache__ (or numba's
+# user-wide cache dir when that isn't writable) so later runs load it instead
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 # ============================================================================
 # DATA LOADING & CARD FILTERING
@@ -39,6 +54,23 @@ def load_cards(
     return pd.DataFrame(cards)
 
 
+# Talent supertypes (FaB CR 2.11.6b)
+TALENT_SUPERTYPES = {
+    "Chaos",
+    "Draconic",
+    "Earth",
+    "Elemental",
+    "Ice",
+    "Light",
+    "Lightning",
+    "Mystic",
+    "Revered",
+    "Reviled",
+    "Royal",
+    "Shadow",
+}
+
+
 def is_kano_eligible(card: Dict) -> bool:
     """Check if card is eligible for Kano's deck (Common/Rare only)
 
@@ -61,22 +93,6 @@ def is_kano_eligible(card: Dict) -> bool:
     """
     types = card.get("types", [])
 
-    # Define talent supertypes (FaB CR 2.11.6b)
-    TALENT_SUPERTYPES = {
-        "Chaos",
-        "Draconic",
-        "Earth",
-        "Elemental",
-        "Ice",
-        "Light",
-        "Lightning",
-        "Mystic",
-        "Revered",
-        "Reviled",
-        "Royal",
-        "Shadow",
-    }
-
     # Must have Wizard class or Generic
     is_wizard = "Wizard" in types
     is_generic = "Generic" in types
@@ -97,6 +113,27 @@ def is_kano_eligible(card: Dict) -> bool:
     return has_common_or_rare
 
 
+def kano_eligible_mask(cards: pd.DataFrame) -> pd.Series:
+    """Vectorized is_kano_eligible over every row of the card DataFrame
+
+    The list columns are exploded to one row per type / printing and reduced
+    back per card with groupby(level=0).any(), so no per-row dicts are built.
+    Most cards already fail the class/talent check, so printings are only
+    exploded for the cards that pass it.
+    """
+    types = cards["types"].explode()
+    is_wizard_or_generic = types.isin(["Wizard", "Generic"]).groupby(level=0).any()
+    has_talent = types.isin(TALENT_SUPERTYPES).groupby(level=0).any()
+    class_ok = (is_wizard_or_generic & ~has_talent).reindex(
+        cards.index, fill_value=False
+    )
+
+    rarities = cards.loc[class_ok, "printings"].explode().str.get("rarity")
+    has_common_or_rare = rarities.isin(["C", "R"]).groupby(level=0).any()
+
+    return has_common_or_rare.reindex(cards.index, fill_value=False)
+
+
 # ============================================================================
 # CARD ANALYSIS
 # ============================================================================
@@ -112,28 +149,56 @@ def parse_numeric(value, default=0):
         return default
 
 
+def parse_numeric_column(values: pd.Series, default=0) -> np.ndarray:
+    """Vectorized parse_numeric over a whole column
+
+    Anything that does not parse as a finite number (blank, "X", "*", ...)
+    becomes default; numbers are truncated to int like int(float(value)).
+    """
+    parsed = pd.to_numeric(values, errors="coerce").to_numpy(np.float64)
+    return np.where(np.isfinite(parsed), np.trunc(parsed), default).astype(np.int64)
+
+
 def analyze_cards(kano_cards: pd.DataFrame) -> pd.DataFrame:
-    """Add derived columns and efficiency metrics"""
+    """Add derived columns and efficiency metrics
+
+    Every derived column is computed with whole-column NumPy/pandas ops.
+    """
     # Add derived columns
-    kano_cards = kano_cards.copy()
-    kano_cards["pitch_val"] = kano_cards["pitch"].apply(lambda x: parse_numeric(x, 0))
-    kano_cards["cost_val"] = kano_cards["cost"].apply(lambda x: parse_numeric(x, 0))
-    kano_cards["power_val"] = kano_cards["power"].apply(lambda x: parse_numeric(x, 0))
-    kano_cards["arcane_val"] = kano_cards["arcane"].apply(lambda x: parse_numeric(x, 0))
-    kano_cards["total_damage"] = kano_cards["power_val"] + kano_cards["arcane_val"]
-
-    # Calculate efficiency metrics
-    kano_cards["damage_per_cost"] = kano_cards.apply(
-        lambda row: row["total_damage"] / max(row["cost_val"], 1), axis=1
+    kano_cards = kano_cards.assign(
+        pitch_val=parse_numeric_column(kano_cards["pitch"]),
+        cost_val=parse_numeric_column(kano_cards["cost"]),
+        power_val=parse_numeric_column(kano_cards["power"]),
+        arcane_val=parse_numeric_column(kano_cards["arcane"]),
     )
+    total_damage = kano_cards["power_val"] + kano_cards["arcane_val"]
 
     # Identify damage sources
-    kano_cards["is_attack"] = kano_cards["types"].apply(
-        lambda x: "Attack" in x if isinstance(x, list) else False
+    is_attack = kano_cards["types"].explode().eq("Attack").groupby(level=0).any()
+
+    return kano_cards.assign(
+        total_damage=total_damage,
+        # Calculate efficiency metrics (zero-cost cards count as cost 1)
+        damage_per_cost=total_damage / np.maximum(kano_cards["cost_val"], 1),
+        is_attack=is_attack.reindex(kano_cards.index, fill_value=False),
+        is_arcane=kano_cards["arcane_val"] > 0,
     )
-    kano_cards["is_arcane"] = kano_cards["arcane_val"] > 0
 
-    return kano_cards
+
+def _top_k_idx(a: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k largest values in a, largest first
+
+    Finds the k-th largest value with an O(N) partition and only sorts the
+    k survivors. Ties keep their original order, as with DataFrame.nlargest.
+    """
+    k = min(k, len(a))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    threshold = np.partition(a, -k)[-k]
+    above = np.flatnonzero(a > threshold)
+    ties = np.flatnonzero(a == threshold)[: k - len(above)]
+    idx = np.sort(np.concatenate((above, ties)))
+    return idx[np.argsort(-a[idx], kind="stable")]
 
 
 # ============================================================================
@@ -162,6 +227,73 @@ class Card:
             color=series.get("color", "Colorless"),
         )
 
+    @classmethod
+    def from_arrays(cls, names, pitches, costs, damages, colors) -> List["Card"]:
+        """Create Cards from parallel column arrays in a single pass"""
+        return [
+            cls(
+                name=name,
+                pitch=int(pitch),
+                cost=int(cost),
+                damage=int(damage),
+                color=color,
+            )
+            for name, pitch, cost, damage, color in zip(
+                names, pitches, costs, damages, colors
+            )
+        ]
+
+
+@dataclass
+class CardDB:
+    """Column store of card features, indexed by card id (row position)
+
+    Decks are int32 arrays of card ids into a CardDB; Card objects are only
+    built from it when a deck has to be played or printed.
+    """
+
+    features: np.ndarray  # (N, 4) float32: damage, pitch, cost, damage_per_cost
+    colors: np.ndarray  # (N,) int8 index into color_names
+    color_names: np.ndarray  # distinct color strings
+    names: np.ndarray  # (N,) object array of card names
+
+    @classmethod
+    def from_frame(cls, card_pool: pd.DataFrame) -> "CardDB":
+        """Build the store from an analyze_cards() DataFrame"""
+        features = np.column_stack(
+            [
+                card_pool[col].to_numpy(np.float32)
+                for col in ("total_damage", "pitch_val", "cost_val", "damage_per_cost")
+            ]
+        )
+        if "color" in card_pool:
+            color_names, colors = np.unique(
+                card_pool["color"].to_numpy(dtype=object), return_inverse=True
+            )
+        else:
+            color_names = np.array(["Colorless"], dtype=object)
+            colors = np.zeros(len(card_pool), dtype=np.int8)
+        return cls(
+            features,
+            colors.astype(np.int8),
+            color_names,
+            card_pool["name"].to_numpy(dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def cards(self, deck_ids: np.ndarray) -> List[Card]:
+        """Build Card objects for a deck of card ids"""
+        stats = self.features[deck_ids, :3].astype(np.int64)
+        return Card.from_arrays(
+            self.names[deck_ids],
+            stats[:, 1],
+            stats[:, 2],
+            stats[:, 0],
+            self.color_names[self.colors[deck_ids]],
+        )
+
 
 @dataclass
 class GameState:
@@ -177,10 +309,23 @@ class GameState:
     current_player: str  # 'player' or 'opponent'
 
     @classmethod
-    def new_game(cls, deck_list: List[Card], hand_size: int = 4):
-        """Initialize a new game with shuffled deck"""
-        deck = deck_list.copy()
-        random.shuffle(deck)
+    def new_game(
+        cls,
+        deck_list: List[Card],
+        hand_size: int = 4,
+        rng: Optional[np.random.Generator] = None,
+        order: Optional[np.ndarray] = None,
+    ):
+        """Initialize a new game with shuffled deck
+
+        order is an already-shuffled array of indices into deck_list; if it
+        is not given, a fresh permutation is drawn from rng.
+        """
+        if order is None:
+            if rng is None:
+                rng = np.random.default_rng()
+            order = rng.permutation(len(deck_list))
+        deck = [deck_list[i] for i in order]
         hand = deck[:hand_size]
         remaining_deck = deck[hand_size:]
         return cls(
@@ -206,13 +351,31 @@ class GameEngine:
     HAND_SIZE = 4
     TARGET_DAMAGE = 40
 
-    def __init__(self, deck: List[Card]):
+    def __init__(self, deck: List[Card], rng: Optional[np.random.Generator] = None):
         self.initial_deck = deck
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Shuffling happens on this index array; Card lists are built from it
+        self._deck_indices = np.arange(len(deck), dtype=np.int16)
         self.reset()
 
-    def reset(self):
-        """Reset game to initial state"""
-        self.state = GameState.new_game(self.initial_deck, self.HAND_SIZE)
+    def reset(self, new_deck: Optional[List[Card]] = None, seed: Optional[int] = None):
+        """Reset game to initial state
+
+        The engine can be reused across games: pass new_deck to swap the deck
+        and seed to reseed the RNG, otherwise the current deck is reshuffled.
+        """
+        if new_deck is not None and new_deck is not self.initial_deck:
+            self.initial_deck = new_deck
+            if len(new_deck) != len(self._deck_indices):
+                self._deck_indices = np.arange(len(new_deck), dtype=np.int16)
+        if seed is not None:
+            # Start from the unshuffled order so a seed always deals the same game
+            self.rng = np.random.default_rng(seed)
+            self._deck_indices[:] = np.arange(len(self._deck_indices))
+        self.rng.shuffle(self._deck_indices)
+        self.state = GameState.new_game(
+            self.initial_deck, self.HAND_SIZE, order=self._deck_indices
+        )
         return self._get_observation()
 
     def _get_observation(self):
@@ -313,6 +476,106 @@ class GameEngine:
         return actions
 
 
+# ============================================================================
+# GREEDY ROLLOUT KERNEL
+# ============================================================================
+
+
+@njit(cache=True, boundscheck=False)
+def _rollout_greedy(stats, deck_perm, hand_size=4, target_damage=40, max_turns=50):
+    """Play one greedy game on card-id arrays (same rules as GameEngine)
+
+    stats is an (N, 3) integer array of (damage, pitch, cost) per card and
+    deck_perm the shuffled card order. Each turn pitches the first two cards
+    in hand, then plays the highest-damage affordable card until none is left.
+    Returns (turns, total damage, damage dealt per turn).
+    """
+    n = deck_perm.shape[0]
+    hand_count = min(hand_size, n)
+    hand = np.empty(hand_size, np.int64)
+    for i in range(hand_count):
+        hand[i] = deck_perm[i]
+    # Deck is a ring buffer over card ids; pitched cards return to the bottom
+    deck = np.empty(max(n, 1), np.int64)
+    head = 0
+    size = 0
+    for i in range(hand_count, n):
+        deck[size] = deck_perm[i]
+        size += 1
+    pitch_zone = np.empty(max(n, 1), np.int64)
+    turn_damage = np.zeros(max_turns, np.int32)
+
+    turn = 1
+    damage = 0
+    while turn <= max_turns:
+        resources = 0
+        turn_start_damage = damage
+
+        # Pitch the first card in hand twice
+        pitch_count = 0
+        while pitch_count < 2 and hand_count > 0:
+            card = hand[0]
+            resources += stats[card, 1]
+            pitch_zone[pitch_count] = card
+            pitch_count += 1
+            for j in range(1, hand_count):
+                hand[j - 1] = hand[j]
+            hand_count -= 1
+
+        # Play the highest-damage card we can afford until none is left
+        while hand_count > 0:
+            best_idx = -1
+            best_damage = 0
+            for j in range(hand_count):
+                card = hand[j]
+                if stats[card, 2] <= resources and stats[card, 0] > best_damage:
+                    best_idx = j
+                    best_damage = stats[card, 0]
+            if best_idx < 0:
+                break
+            card = hand[best_idx]
+            resources -= stats[card, 2]
+            damage += stats[card, 0]
+            for j in range(best_idx + 1, hand_count):
+                hand[j - 1] = hand[j]
+            hand_count -= 1
+
+        # End turn: pitched cards go to the bottom of the deck
+        for j in range(pitch_count):
+            deck[(head + size) % n] = pitch_zone[j]
+            size += 1
+        turn_damage[turn - 1] = damage - turn_start_damage
+        if damage >= target_damage:
+            return turn, damage, turn_damage[:turn]
+
+        # Draw up to hand size for the next turn
+        while hand_count < hand_size and size > 0:
+            hand[hand_count] = deck[head]
+            head = (head + 1) % n
+            size -= 1
+            hand_count += 1
+        turn += 1
+
+        if size == 0 and hand_count == 0:
+            break
+
+    return turn, damage, turn_damage[: min(turn, max_turns)]
+
+
+def evaluate_deck_greedy(
+    deck: List[Card], num_runs: int = 100, rng: Optional[np.random.Generator] = None
+) -> float:
+    """Average turns to win for the greedy strategy over num_runs shuffles"""
+    if rng is None:
+        rng = np.random.default_rng()
+    stats = deck_stats_array(deck).astype(np.int64)
+    turns = np.empty(num_runs)
+    for run in range(num_runs):
+        turn, damage, _ = _rollout_greedy(stats, rng.permutation(len(deck)))
+        turns[run] = turn if damage >= GameEngine.TARGET_DAMAGE else 50
+    return turns.mean()
+
+
 # ============================================================================
 # GYMNASIUM RL ENVIRONMENT
 # ============================================================================
@@ -321,11 +584,15 @@ class GameEngine:
 class FastestTo40Env(gym.Env):
     """Gymnasium environment for Fastest to 40"""
 
+    COLOR_CODES = {"Red": 0, "Yellow": 1, "Blue": 2, "Colorless": 3}
+
     def __init__(self, deck: List[Card], num_runs=10):
         super().__init__()
         self.deck = deck
         self.num_runs = num_runs
         self.game = None
+        # Per-environment RNG so parallel environments never share seed state
+        self.rng: np.random.Generator = np.random.default_rng()
 
         # Observation space: hand (4 cards) + resources + damage + turn
         # Each card: [pitch, cost, damage, color_encoded]
@@ -339,17 +606,35 @@ class FastestTo40Env(gym.Env):
         # 4-7: play card 0-3
         # 8: end turn
         self.action_space = spaces.Discrete(9)
+        # Card actions 0-7 -> (handler, card index, reward on success),
+        # bound to the GameEngine when the first reset creates it
+        self._dispatch: Tuple = ()
 
     def reset(self, seed=None):
-        """Reset environment with new game"""
-        if seed is not None:
-            random.seed(seed)
-        self.game = GameEngine(self.deck)
-        self.game.reset()
+        """Reset environment with new game
+
+        The GameEngine is created on the first reset and reused afterwards.
+        """
+        if self.game is None:
+            if seed is not None:
+                self.rng = np.random.default_rng(seed)
+            self.game = GameEngine(self.deck, rng=self.rng)
+            # Pitching costs the usual per-action penalty; a successful play
+            # earns a small reward (no incremental damage tracking)
+            self._dispatch = tuple(
+                (self.game.pitch_card, i, -0.1) for i in range(4)
+            ) + tuple((self.game.play_card, i, 0.5) for i in range(4))
+        else:
+            self.game.reset(new_deck=self.deck, seed=seed)
+            self.rng = self.game.rng
         return self._get_obs(), {}
 
     def _get_obs(self):
-        """Convert game state to observation vector"""
+        """Convert game state to observation vector
+
+        A fresh float32 array is returned on every call: PolicyNetwork wraps it
+        with torch.from_numpy without copying, so it must not be reused.
+        """
         obs = np.zeros(19, dtype=np.float32)
 
         # Encode hand (4 cards, 4 features each)
@@ -358,9 +643,7 @@ class FastestTo40Env(gym.Env):
             obs[base] = card.pitch / 3.0  # Normalize
             obs[base + 1] = card.cost / 5.0  # Normalize
             obs[base + 2] = card.damage / 10.0  # Normalize
-            obs[base + 3] = {"Red": 0, "Yellow": 1, "Blue": 2, "Colorless": 3}.get(
-                card.color, 3
-            ) / 3.0
+            obs[base + 3] = self.COLOR_CODES.get(card.color, 3) / 3.0
 
         # Global state
         obs[16] = self.game.state.resources / 10.0
@@ -371,25 +654,13 @@ class FastestTo40Env(gym.Env):
 
     def step(self, actions):
         """Execute one action in the environment"""
-        reward = -0.1  # Small penalty for each action (encourage efficiency)
-
-        if actions < 4:
-            # Pitch card
-            success = self.game.pitch_card(actions)
-            if not success:
-                reward = -1  # Invalid action penalty
-        elif actions < 8:
-            # Play card
-            card_idx = actions - 4
-            success = self.game.play_card(card_idx)
-            if success:
-                # Reward for dealing damage (card_damage was dealt this turn)
-                # Note: We don't have incremental tracking, so just give small reward
-                reward = 0.5
-            else:
-                reward = -1  # Invalid action penalty
+        if actions < 8:
+            # Pitch or play a card
+            handler, card_idx, success_reward = self._dispatch[actions]
+            reward = success_reward if handler(card_idx) else -1  # Invalid action
         else:
             # End turn
+            reward = -0.1  # Small penalty for each action (encourage efficiency)
             won = self.game.end_turn()
             if won:
                 reward = (
@@ -405,24 +676,73 @@ class FastestTo40Env(gym.Env):
 
     def evaluate_deck(self):
         """Run multiple games and return average turns to win"""
-        turns_to_win = []
+        envs = FastestTo40VectorEnv([self.deck] * self.num_runs)
+        envs.reset(seeds=range(self.num_runs))
+
+        while not envs.done.all():
+            # Random policy for now (will be replaced by trained agent)
+            actions = self.action_space.np_random.integers(
+                self.action_space.n, size=envs.num_envs
+            )
+            envs.step(actions)
+
+        return np.mean(envs.turns_to_win())
 
-        for run in range(self.num_runs):
-            obs, _ = self.reset(seed=run)
-            done = False
 
-            while not done:
-                # Random policy for now (will be replaced by trained agent)
-                action = self.action_space.sample()
-                obs, reward, terminated, truncated, _ = self.step(action)
-                done = terminated or truncated
+class FastestTo40VectorEnv:
+    """Runs several FastestTo40Env games in lockstep
 
-            if self.game.state.damage_dealt >= 40:
-                turns_to_win.append(self.game.state.turn_number)
-            else:
-                turns_to_win.append(50)  # Cap at 50 turns for failed games
+    Observations come back as one (num_envs, 19) batch, so a policy can pick
+    every environment's action with a single forward pass. Finished games are
+    not reset: they keep their final observation and ignore further actions
+    until the next reset().
+    """
+
+    def __init__(self, decks: List[List[Card]]):
+        self.envs = [FastestTo40Env(deck, num_runs=1) for deck in decks]
+        self.num_envs = len(self.envs)
+        self.single_observation_space = self.envs[0].observation_space
+        self.single_action_space = self.envs[0].action_space
+        self.done = np.zeros(self.num_envs, dtype=bool)
+        self._obs = np.zeros((self.num_envs, 19), dtype=np.float32)
+
+    def reset(self, seeds=None):
+        """Reset every game; seeds gives one seed per environment"""
+        if seeds is None:
+            seeds = [None] * self.num_envs
+        self._obs = np.stack(
+            [env.reset(seed=seed)[0] for env, seed in zip(self.envs, seeds)]
+        )
+        self.done[:] = False
+        return self._obs, {}
 
-        return np.mean(turns_to_win)
+    def step(self, actions):
+        """Apply actions[i] to every game that is still running"""
+        # Fresh batch each step: PolicyNetwork aliases it via torch.from_numpy
+        obs = self._obs.copy()
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+
+        for i, env in enumerate(self.envs):
+            if self.done[i]:
+                continue
+            obs[i], rewards[i], terminated[i], truncated[i], _ = env.step(
+                int(actions[i])
+            )
+
+        self.done |= terminated | truncated
+        self._obs = obs
+        return obs, rewards, terminated, truncated, {}
+
+    def turns_to_win(self) -> np.ndarray:
+        """Turns taken per game, capped at 50 for games that missed 40 damage"""
+        return np.array(
+            [
+                env.game.state.turn_number if env.game.state.damage_dealt >= 40 else 50
+                for env in self.envs
+            ]
+        )
 
 
 # ============================================================================
@@ -453,7 +773,8 @@ class PolicyNetwork(nn.Module):
     def forward(self, x):
         """Forward pass"""
         if isinstance(x, np.ndarray):
-            x = torch.FloatTensor(x)
+            # Zero-copy for the float32 observations the env produces
+            x = torch.from_numpy(np.asarray(x, dtype=np.float32))
 
         features = self.network(x)
         logits = self.policy_head(features)
@@ -462,16 +783,33 @@ class PolicyNetwork(nn.Module):
         return logits, value
 
     def get_action(self, obs, deterministic=False):
-        """Get action from observation"""
+        """Get action from observation
+
+        Returns the action as a 0-d tensor so callers can feed it straight
+        back into log_prob; use .item() to get the int for env.step().
+        """
         logits, value = self.forward(obs)
 
         if deterministic:
             action = torch.argmax(logits, dim=-1)
         else:
-            dist = Categorical(logits=logits)
-            action = dist.sample()
+            # Same draw as Categorical(logits=logits).sample(), without
+            # building a distribution object per step
+            action = torch.multinomial(logits.softmax(dim=-1), 1, True).squeeze(-1)
+
+        return action, logits, value
 
-        return action.item(), logits, value
+    @torch.no_grad()
+    def get_actions_batch(self, obs: np.ndarray, deterministic=False) -> np.ndarray:
+        """Pick actions for a (N, 19) batch of observations in one pass
+
+        Returns an int64 array of N actions, ready for FastestTo40VectorEnv.step().
+        """
+        logits, _ = self.forward(obs)
+        if deterministic:
+            return logits.argmax(dim=-1).numpy()
+        probs = logits.softmax(dim=-1)
+        return torch.multinomial(probs, 1).squeeze(-1).numpy()
 
     def save(self, path: str):
         """Save policy to file"""
@@ -524,11 +862,10 @@ def train_agent(deck: List[Card], total_timesteps: int = 50000, verbose=True):
         action, logits, value = policy.get_action(obs, deterministic=False)
 
         # Calculate log probability
-        dist = Categorical(logits=logits)
-        log_prob = dist.log_prob(torch.tensor(action))
+        log_prob = logits.log_softmax(dim=-1)[action]
 
         # Take step in environment
-        next_obs, reward, terminated, truncated, _ = env.step(action)
+        next_obs, reward, terminated, truncated, _ = env.step(action.item())
         done = terminated or truncated
 
         # Store trajectory
@@ -623,31 +960,35 @@ def train_agent(deck: List[Card], total_timesteps: int = 50000, verbose=True):
     return policy
 
 
+def evaluate_decks_with_policy(
+    decks: List[List[Card]], policy: PolicyNetwork, num_runs: int = 10
+) -> np.ndarray:
+    """Play num_runs games of every deck and return a (len(decks), num_runs)
+    array of turns to win (50 for games that failed to reach the target)
+
+    All games run side by side in one FastestTo40VectorEnv, so each step is
+    a single (len(decks) * num_runs, 19) forward pass. Run r of every deck
+    is seeded with r, so a deck scores the same alone or in a batch.
+    """
+    envs = FastestTo40VectorEnv([deck for deck in decks for _ in range(num_runs)])
+    obs, _ = envs.reset(seeds=np.tile(np.arange(num_runs), len(decks)).tolist())
+    action_count = 0
+    max_actions = 500  # Safety limit
+
+    while not envs.done.all() and action_count < max_actions:
+        # Use policy to select action (greedy)
+        actions = policy.get_actions_batch(obs, deterministic=True)
+        obs, _, _, _, _ = envs.step(actions)
+        action_count += 1
+
+    return envs.turns_to_win().reshape(len(decks), num_runs)
+
+
 def evaluate_deck_with_policy(
     deck: List[Card], policy: PolicyNetwork, num_runs: int = 10, verbose=False
 ) -> float:
     """Evaluate a deck using trained policy"""
-    env = FastestTo40Env(deck, num_runs=num_runs)
-    turns = []
-
-    for run in range(num_runs):
-        obs, _ = env.reset(seed=run)
-        done = False
-        action_count = 0
-        max_actions = 500  # Safety limit
-
-        while not done and action_count < max_actions:
-            # Use policy to select action (greedy)
-            action, _, _ = policy.get_action(obs, deterministic=True)
-            obs, reward, terminated, truncated, _ = env.step(action)
-            done = terminated or truncated
-            action_count += 1
-
-        if env.game.state.damage_dealt >= 40:
-            turns.append(env.game.state.turn_number)
-        else:
-            turns.append(50)  # Failed to reach target
-
+    turns = evaluate_decks_with_policy([deck], policy, num_runs=num_runs)[0]
     avg_turns = np.mean(turns)
 
     if verbose:
@@ -658,17 +999,113 @@ def evaluate_deck_with_policy(
     return avg_turns
 
 
+# Policy rebuilt once per evaluation worker process by _init_eval_worker
+_worker_policy: Optional[PolicyNetwork] = None
+
+
+def _init_eval_worker(policy_state: Dict[str, torch.Tensor]):
+    """Pool initializer: rebuild the trained policy from its state_dict
+
+    Each worker runs torch single-threaded: the MLP is far too small to gain
+    from intra-op threads, and N workers each using every core would
+    oversubscribe the machine.
+    """
+    global _worker_policy
+    torch.set_num_threads(1)
+    _worker_policy = PolicyNetwork(obs_dim=19, action_dim=9, hidden_size=64)
+    _worker_policy.load_state_dict(policy_state)
+    _worker_policy.eval()
+
+
+def _evaluate_batch(
+    batch: List[Tuple[int, List[Card]]],
+    num_runs: int,
+    policy: Optional[PolicyNetwork] = None,
+) -> List[Tuple[int, float]]:
+    """Evaluate a batch of (candidate index, deck) pairs in one vector env
+
+    Runs in a pool worker with the worker's policy unless one is given.
+    """
+    turns = evaluate_decks_with_policy(
+        [deck for _, deck in batch],
+        policy if policy is not None else _worker_policy,
+        num_runs=num_runs,
+    )
+    return [(i, avg_turns) for (i, _), avg_turns in zip(batch, turns.mean(axis=1))]
+
+
+def _evaluate_candidates(
+    tasks: List[Tuple[int, List[Card]]],
+    policy: PolicyNetwork,
+    num_workers: int,
+    num_runs: int,
+):
+    """Yield (candidate index, avg turns) as candidate evaluations finish
+
+    Candidates are grouped into batches that are played together, so every
+    policy forward pass covers a whole batch of games.
+    """
+    # A few batches per worker keeps workers balanced and progress visible
+    batch_size = max(1, len(tasks) // (max(num_workers, 1) * 4))
+    batches = [tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)]
+
+    if num_workers <= 1:
+        # Not worth a pool: evaluate in-process with the trained policy
+        for batch in batches:
+            yield from _evaluate_batch(batch, num_runs, policy)
+        return
+
+    # Workers are spawned, not forked: the parent has already started torch's
+    # thread pools while training, and a forked copy of them can deadlock.
+    # Each worker gets only the policy weights, once, via the initializer;
+    # the card pool stays in the parent and batches carry their own decks.
+    with mp.get_context("spawn").Pool(
+        processes=num_workers,
+        initializer=_init_eval_worker,
+        initargs=(policy.state_dict(),),
+    ) as pool:
+        for results in pool.imap_unordered(
+            partial(_evaluate_batch, num_runs=num_runs), batches
+        ):
+            yield from results
+
+
 # ============================================================================
 # DECK OPTIMIZATION
 # ============================================================================
 
 
 def generate_candidate_decks(
-    card_pool: pd.DataFrame, num_decks: int = 100, strategy: str = "random"
+    card_pool: pd.DataFrame,
+    num_decks: int = 100,
+    strategy: str = "random",
+    rng: Optional[np.random.Generator] = None,
 ) -> List[List[Card]]:
     """Generate candidate decks using different strategies"""
+    card_db = CardDB.from_frame(card_pool)
+    return [
+        card_db.cards(deck_ids)
+        for deck_ids in generate_candidate_deck_ids(
+            card_pool, num_decks=num_decks, strategy=strategy, rng=rng
+        )
+    ]
+
+
+def generate_candidate_deck_ids(
+    card_pool: pd.DataFrame,
+    num_decks: int = 100,
+    strategy: str = "random",
+    rng: Optional[np.random.Generator] = None,
+) -> List[np.ndarray]:
+    """Generate candidate decks as card id arrays, see generate_candidate_decks
+
+    Each deck is an int32 array of 40 card ids (row positions in card_pool,
+    i.e. ids into CardDB.from_frame(card_pool)).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
     decks = []
-    eligible_cards = card_pool[card_pool["total_damage"] > 0].copy()
+    eligible_cards = card_pool[card_pool["total_damage"] > 0]
 
     if len(eligible_cards) == 0:
         raise ValueError("No eligible cards with damage > 0 found in card pool")
@@ -676,51 +1113,45 @@ def generate_candidate_decks(
     print(f"  Generating {num_decks} candidate decks using '{strategy}' strategy...")
     print(f"  Card pool: {len(eligible_cards)} cards with damage > 0")
 
+    # Column arrays are extracted once and shared by every deck
+    pool_idx = np.flatnonzero(card_pool["total_damage"].to_numpy() > 0)
+    pool_pitch = eligible_cards["pitch_val"].to_numpy(np.int8)
+    weights = eligible_cards["damage_per_cost"].to_numpy(np.float64)
+    weights = weights / weights.sum()
+    # (labels, count) per colour for the balanced strategy:
+    # 12 red (pitch 1), 16 yellow (pitch 2), 12 blue (pitch 3)
+    color_quotas = [
+        (pool_idx[pool_pitch == 1], 12),
+        (pool_idx[pool_pitch == 2], 16),
+        (pool_idx[pool_pitch == 3], 12),
+    ]
+
     for i in range(num_decks):
         if strategy == "random":
             # Fully random deck composition
-            deck_indices = np.random.choice(eligible_cards.index, size=40, replace=True)
-            deck = [Card.from_series(eligible_cards.loc[idx]) for idx in deck_indices]
+            draws = rng.choice(len(pool_idx), size=40, replace=True)
+            deck = pool_idx[draws].astype(np.int32)
 
         elif strategy == "high_efficiency":
             # Bias towards high damage efficiency cards
-            weights = eligible_cards["damage_per_cost"].values
-            weights = weights / weights.sum()
-            deck_indices = np.random.choice(
-                eligible_cards.index, size=40, replace=True, p=weights
-            )
-            deck = [Card.from_series(eligible_cards.loc[idx]) for idx in deck_indices]
+            draws = rng.choice(len(pool_idx), size=40, replace=True, p=weights)
+            deck = pool_idx[draws].astype(np.int32)
 
         elif strategy == "balanced":
             # Mix of high efficiency and resource balance
             # Aim for ~30% red (pitch 1), ~40% yellow (pitch 2), ~30% blue (pitch 3)
-            deck = []
-            red_cards = eligible_cards[eligible_cards["pitch_val"] == 1]
-            yellow_cards = eligible_cards[eligible_cards["pitch_val"] == 2]
-            blue_cards = eligible_cards[eligible_cards["pitch_val"] == 3]
-
-            # Add red cards (12 cards, 30%)
-            if len(red_cards) > 0:
-                for _ in range(12):
-                    card = Card.from_series(red_cards.sample(1).iloc[0])
-                    deck.append(card)
-
-            # Add yellow cards (16 cards, 40%)
-            if len(yellow_cards) > 0:
-                for _ in range(16):
-                    card = Card.from_series(yellow_cards.sample(1).iloc[0])
-                    deck.append(card)
-
-            # Add blue cards (12 cards, 30%)
-            if len(blue_cards) > 0:
-                for _ in range(12):
-                    card = Card.from_series(blue_cards.sample(1).iloc[0])
-                    deck.append(card)
+            parts = [
+                rng.choice(ids, size=count, replace=True)
+                for ids, count in color_quotas
+                if len(ids) > 0
+            ]
 
             # Fill remaining with random if needed
-            while len(deck) < 40:
-                card = Card.from_series(eligible_cards.sample(1).iloc[0])
-                deck.append(card)
+            filled = sum(len(part) for part in parts)
+            if filled < 40:
+                parts.append(rng.choice(pool_idx, size=40 - filled, replace=True))
+
+            deck = np.concatenate(parts).astype(np.int32)
 
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
@@ -740,8 +1171,13 @@ def optimize_deck(
     evaluation_runs: int = 10,
     top_k: int = 5,
     verbose: bool = True,
+    num_workers: int = 1,
 ):
-    """Find optimal deck composition using RL-trained policy"""
+    """Find optimal deck composition using RL-trained policy
+
+    Candidates are evaluated in-process by default; pass num_workers > 1 to
+    opt in to evaluating them across that many worker processes.
+    """
 
     if verbose:
         print(f"\n{'=' * 60}")
@@ -757,46 +1193,48 @@ def optimize_deck(
     candidates = []
 
     # Generate decks with different strategies
-    random_decks = generate_candidate_decks(
+    random_decks = generate_candidate_deck_ids(
         card_pool, num_decks=num_candidates // 3, strategy="random"
     )
     candidates.extend(random_decks)
 
-    efficiency_decks = generate_candidate_decks(
+    efficiency_decks = generate_candidate_deck_ids(
         card_pool, num_decks=num_candidates // 3, strategy="high_efficiency"
     )
     candidates.extend(efficiency_decks)
 
-    balanced_decks = generate_candidate_decks(
+    balanced_decks = generate_candidate_deck_ids(
         card_pool, num_decks=num_candidates - len(candidates), strategy="balanced"
     )
     candidates.extend(balanced_decks)
 
     print(f"  Total candidates generated: {len(candidates)}")
+    card_db = CardDB.from_frame(card_pool)
 
     # Train a policy on a representative deck first
     print(f"\n[2/4] Training base policy on representative deck...")
     # Use a high-efficiency deck for training
-    base_deck = efficiency_decks[0]
+    base_deck = card_db.cards(efficiency_decks[0])
     policy = train_agent(base_deck, total_timesteps=training_timesteps, verbose=verbose)
 
     # Evaluate all candidates
     print(f"\n[3/4] Evaluating all candidates...")
     results = []
-    for i, deck in enumerate(candidates):
-        avg_turns = evaluate_deck_with_policy(
-            deck, policy, num_runs=evaluation_runs, verbose=False
-        )
-        results.append((avg_turns, deck, i))
-
-        if (i + 1) % 10 == 0:
+    tasks = [(i, card_db.cards(deck_ids)) for i, deck_ids in enumerate(candidates)]
+    num_workers = max(1, min(num_workers, len(tasks)))
+    for i, avg_turns in _evaluate_candidates(
+        tasks, policy, num_workers, evaluation_runs
+    ):
+        results.append((avg_turns, candidates[i], i))
+
+        if len(results) % 10 == 0:
             best_so_far = min(r[0] for r in results)
             print(
-                f"    Evaluated {i + 1}/{len(candidates)} decks | Best so far: {best_so_far:.2f} turns"
+                f"    Evaluated {len(results)}/{len(candidates)} decks | Best so far: {best_so_far:.2f} turns"
             )
 
-    # Sort by average turns (lower is better)
-    results.sort(key=lambda x: x[0])
+    # Sort by average turns (lower is better), candidate order breaks ties
+    results.sort(key=lambda x: (x[0], x[2]))
 
     print(f"\n[4/4] Optimization complete!")
     print(f"  Best deck: {results[0][0]:.2f} turns")
@@ -804,7 +1242,11 @@ def optimize_deck(
     print(f"  Average: {np.mean([r[0] for r in results]):.2f} turns")
     print(f"  Returning top {top_k} decks")
 
-    return results[:top_k], policy
+    top_decks = [
+        (avg_turns, card_db.cards(deck_ids), i)
+        for avg_turns, deck_ids, i in results[:top_k]
+    ]
+    return top_decks, policy
 
 
 def save_deck(deck: List[Card], filename: str, avg_turns: float, rank: int = 1):
@@ -812,7 +1254,7 @@ def save_deck(deck: List[Card], filename: str, avg_turns: float, rank: int = 1):
     with open(filename, "w") as f:
         f.write(f"# Fastest to 40 - Optimal Deck #{rank}\n")
         f.write(f"# Average Turns: {avg_turns:.2f}\n")
-        f.write(f"# Generated: {pd.Timestamp.now()}\n\n")
+        f.write(f"# Generated: {datetime.now()}\n\n")
 
         # Count card frequencies
         card_counts = defaultdict(int)
@@ -850,24 +1292,56 @@ def save_deck(deck: List[Card], filename: str, avg_turns: float, rank: int = 1):
 # ============================================================================
 
 
+def deck_stats_array(deck: List[Card]) -> np.ndarray:
+    """Return a (len(deck), 3) float32 array of (damage, pitch, cost) per card"""
+    return np.fromiter(
+        (value for card in deck for value in (card.damage, card.pitch, card.cost)),
+        dtype=np.float32,
+        count=len(deck) * 3,
+    ).reshape(-1, 3)
+
+
+def deck_means(deck: List[Card]) -> Tuple[float, float, float]:
+    """Return the deck's (avg damage, avg pitch, avg cost) in one reduction"""
+    avg_damage, avg_pitch, avg_cost = deck_stats_array(deck).mean(
+        axis=0, dtype=np.float64
+    )
+    return avg_damage, avg_pitch, avg_cost
+
+
+def color_counts(deck: List[Card]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the deck's distinct colors and their card counts, most common first
+
+    Ties keep the order in which the colors first appear in the deck, as
+    pd.Series.value_counts does.
+    """
+    colors, first_seen, counts = np.unique(
+        np.array([card.color for card in deck], dtype=object),
+        return_index=True,
+        return_counts=True,
+    )
+    order = np.lexsort((first_seen, -counts))
+    return colors[order], counts[order]
+
+
 def analyze_deck(deck: List[Card]) -> Dict:
     """Analyze deck composition and return statistics"""
-    colors = [card.color for card in deck]
-    pitches = [card.pitch for card in deck]
-    damages = [card.damage for card in deck]
-    costs = [card.cost for card in deck]
+    colors, counts = color_counts(deck)
+    stats_arr = deck_stats_array(deck)
+    avg_damage, avg_pitch, avg_cost = stats_arr.mean(axis=0, dtype=np.float64)
+    pitch_counts = np.bincount(stats_arr[:, 1].astype(np.int8), minlength=4)
 
     stats = {
         "total_cards": len(deck),
-        "color_distribution": pd.Series(colors).value_counts().to_dict(),
-        "avg_pitch": np.mean(pitches),
-        "avg_damage": np.mean(damages),
-        "avg_cost": np.mean(costs),
-        "total_damage_potential": sum(damages),
+        "color_distribution": dict(zip(colors.tolist(), counts.tolist())),
+        "avg_pitch": avg_pitch,
+        "avg_damage": avg_damage,
+        "avg_cost": avg_cost,
+        "total_damage_potential": int(stats_arr[:, 0].sum()),
         "pitch_distribution": {
-            "red": sum(1 for p in pitches if p == 1),
-            "yellow": sum(1 for p in pitches if p == 2),
-            "blue": sum(1 for p in pitches if p == 3),
+            "red": int(pitch_counts[1]),
+            "yellow": int(pitch_counts[2]),
+            "blue": int(pitch_counts[3]),
         },
     }
 
@@ -910,17 +1384,20 @@ def simulate_game(deck: List[Card], policy: PolicyNetwork, verbose=True, seed=No
         print("SAMPLE GAMEPLAY")
         print("=" * 60)
 
-    turn_log = []
     done = False
     action_count = 0
     max_actions = 500
 
-    current_turn = 1
+    # One (turn, damage, total_damage) row per turn, plus the actions taken
+    turn_log = np.empty((max_actions, 3), dtype=np.int32)
+    turn_actions_log = []
+    turns_logged = 0
     turn_actions = []
 
     while not done and action_count < max_actions:
         # Get action from policy
         action, _, _ = policy.get_action(obs, deterministic=True)
+        action = action.item()
 
         # Record state before action
         prev_turn = env.game.state.turn_number
@@ -932,27 +1409,18 @@ def simulate_game(deck: List[Card], policy: PolicyNetwork, verbose=True, seed=No
         done = terminated or truncated
         action_count += 1
 
-        # Decode action
-        if action < 4:
-            action_str = f"Pitch card {action}"
-        elif action < 8:
-            action_str = f"Play card {action - 4}"
-        else:
-            action_str = "End turn"
-
-        turn_actions.append(action_str)
+        turn_actions.append(action)
 
         # Check if turn ended
         if env.game.state.turn_number != prev_turn or done:
             damage_this_turn = env.game.state.damage_dealt - prev_damage
-            turn_log.append(
-                {
-                    "turn": prev_turn,
-                    "actions": turn_actions.copy(),
-                    "damage": damage_this_turn,
-                    "total_damage": env.game.state.damage_dealt,
-                }
+            turn_log[turns_logged] = (
+                prev_turn,
+                damage_this_turn,
+                env.game.state.damage_dealt,
             )
+            turn_actions_log.append(turn_actions)
+            turns_logged += 1
             turn_actions = []
 
     if verbose:
@@ -960,13 +1428,21 @@ def simulate_game(deck: List[Card], policy: PolicyNetwork, verbose=True, seed=No
         print(f"Total damage dealt: {env.game.state.damage_dealt}")
         print(f"Target reached: {env.game.state.damage_dealt >= 40}")
 
+        # Decode actions only for the turns that are printed
+        action_names = (
+            [f"Pitch card {i}" for i in range(4)]
+            + [f"Play card {i}" for i in range(4)]
+            + ["End turn"]
+        )
+
         print(f"\nTurn-by-turn breakdown:")
-        for entry in turn_log[:10]:  # Show first 10 turns
-            print(
-                f"  Turn {entry['turn']}: +{entry['damage']} damage (total: {entry['total_damage']})"
-            )
-            if verbose and len(entry["actions"]) > 0:
-                print(f"    Actions: {', '.join(entry['actions'][:5])}")
+        shown = min(10, turns_logged)  # Show first 10 turns
+        for (turn, damage, total_damage), actions in zip(
+            turn_log[:shown], turn_actions_log[:shown]
+        ):
+            print(f"  Turn {turn}: +{damage} damage (total: {total_damage})")
+            if verbose and len(actions) > 0:
+                print(f"    Actions: {', '.join(action_names[a] for a in actions[:5])}")
 
     return env.game.state.turn_number, env.game.state.damage_dealt
 
@@ -987,7 +1463,7 @@ if __name__ == "__main__":
 
     # Filter for Kano-eligible cards
     print("\n[2/3] Filtering for Kano-eligible cards...")
-    eligible_mask = all_cards.apply(lambda row: is_kano_eligible(row.to_dict()), axis=1)
+    eligible_mask = kano_eligible_mask(all_cards)
     kano_cards = all_cards[eligible_mask].copy()
     print(f"  Kano-eligible cards (Common/Rare Wizard+Generic): {len(kano_cards)}")
 
@@ -1000,34 +1476,53 @@ if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("CARD POOL SUMMARY")
     print("=" * 60)
-    print(f"Total eligible cards: {len(kano_cards)}")
-    print(f"Cards with damage > 0: {len(kano_cards[kano_cards['total_damage'] > 0])}")
-    print(f"Attack cards: {kano_cards['is_attack'].sum()}")
-    print(f"Arcane damage cards: {kano_cards['is_arcane'].sum()}")
+    # Pull the columns out once and reduce the raw arrays
+    total_damage = kano_cards["total_damage"].to_numpy()
+    print(f"Total eligible cards: {len(total_damage)}")
+    print(f"Cards with damage > 0: {np.count_nonzero(total_damage > 0)}")
+    print(f"Attack cards: {np.count_nonzero(kano_cards['is_attack'].to_numpy())}")
+    print(
+        f"Arcane damage cards: {np.count_nonzero(kano_cards['is_arcane'].to_numpy())}"
+    )
 
     print("\n" + "-" * 60)
     print("Top 10 Cards by Damage Efficiency")
     print("-" * 60)
-    top_damage = kano_cards[kano_cards["total_damage"] > 0].nlargest(
-        10, "damage_per_cost"
-    )
-    for idx, row in top_damage.iterrows():
+    damage_cards = kano_cards[kano_cards["total_damage"] > 0]
+    top_damage = damage_cards.iloc[
+        _top_k_idx(damage_cards["damage_per_cost"].to_numpy(), 10)
+    ]
+    for name, cost, damage, efficiency in zip(
+        top_damage["name"].str.slice(0, 40),
+        top_damage["cost_val"].to_numpy(),
+        top_damage["total_damage"].to_numpy(),
+        top_damage["damage_per_cost"].to_numpy(),
+    ):
         print(
-            f"  {row['name'][:40]:<40} | Cost: {row['cost_val']:2d} | Damage: {row['total_damage']:2d} | Efficiency: {row['damage_per_cost']:.2f}"
+            f"  {name:<40} | Cost: {cost:2d} | Damage: {damage:2d} | Efficiency: {efficiency:.2f}"
         )
 
     print("\n" + "-" * 60)
     print("Sample High-Damage Cards")
     print("-" * 60)
-    high_damage = kano_cards[kano_cards["total_damage"] >= 5].nlargest(
-        10, "total_damage"
+    high_damage = kano_cards[kano_cards["total_damage"] >= 5]
+    high_damage = high_damage.iloc[
+        _top_k_idx(high_damage["total_damage"].to_numpy(), 10)
+    ]
+    card_types = np.select(
+        [high_damage["is_attack"].to_numpy(), high_damage["is_arcane"].to_numpy()],
+        ["Attack", "Arcane"],
+        default="Other",
     )
-    for idx, row in high_damage.iterrows():
-        card_type = (
-            "Attack" if row["is_attack"] else "Arcane" if row["is_arcane"] else "Other"
-        )
+    for name, card_type, pitch, cost, damage in zip(
+        high_damage["name"].str.slice(0, 40),
+        card_types,
+        high_damage["pitch_val"].to_numpy(),
+        high_damage["cost_val"].to_numpy(),
+        high_damage["total_damage"].to_numpy(),
+    ):
         print(
-            f"  {row['name'][:40]:<40} | Type: {card_type:<6} | Pitch: {row['pitch_val']} | Cost: {row['cost_val']:2d} | Damage: {row['total_damage']:2d}"
+            f"  {name:<40} | Type: {card_type:<6} | Pitch: {pitch} | Cost: {cost:2d} | Damage: {damage:2d}"
         )
 
     print("\n" + "=" * 60)
@@ -1042,17 +1537,31 @@ if __name__ == "__main__":
     print("=" * 60)
 
     # Create a sample deck from top damage cards
-    print("\n[1/4] Creating sample deck...")
+    print("\n[1/5] Creating sample deck...")
     damage_cards = kano_cards[kano_cards["total_damage"] > 0].copy()
-    sample_deck_data = damage_cards.nlargest(40, "damage_per_cost")
-    sample_deck = [Card.from_series(row) for _, row in sample_deck_data.iterrows()]
+    sample_deck_data = damage_cards.iloc[
+        _top_k_idx(damage_cards["damage_per_cost"].to_numpy(), 40)
+    ]
+    # Cards without a color column default to Colorless, as in Card.from_series
+    if "color" in sample_deck_data:
+        sample_colors = sample_deck_data["color"].to_numpy()
+    else:
+        sample_colors = np.full(len(sample_deck_data), "Colorless", dtype=object)
+    sample_deck = Card.from_arrays(
+        *(
+            sample_deck_data[col].to_numpy()
+            for col in ("name", "pitch_val", "cost_val", "total_damage")
+        ),
+        sample_colors,
+    )
     print(f"  Sample deck created: {len(sample_deck)} cards")
-    print(f"  Average damage: {np.mean([c.damage for c in sample_deck]):.2f}")
-    print(f"  Average pitch: {np.mean([c.pitch for c in sample_deck]):.2f}")
-    print(f"  Average cost: {np.mean([c.cost for c in sample_deck]):.2f}")
+    avg_damage, avg_pitch, avg_cost = deck_means(sample_deck)
+    print(f"  Average damage: {avg_damage:.2f}")
+    print(f"  Average pitch: {avg_pitch:.2f}")
+    print(f"  Average cost: {avg_cost:.2f}")
 
     # Initialize game engine
-    print("\n[2/4] Initializing GameEngine...")
+    print("\n[2/5] Initializing GameEngine...")
     game = GameEngine(sample_deck)
     obs = game.reset()
     print(f"  Game initialized!")
@@ -1062,7 +1571,7 @@ if __name__ == "__main__":
     print(f"  Damage dealt: {obs['damage_dealt']}")
 
     # Test basic game mechanics
-    print("\n[3/4] Testing game mechanics...")
+    print("\n[3/5] Testing game mechanics...")
     print(f"  Initial hand: {[c.name[:30] for c in game.state.hand]}")
 
     # Pitch a card
@@ -1110,9 +1619,11 @@ if __name__ == "__main__":
     print(f"    (Note: Opponent automatically passed their turn)")
 
     # Run a full test game
-    print("\n[4/4] Running full test game (max 50 turns)...")
+    print("\n[4/5] Running full test game (max 50 turns)...")
     game.reset()
-    turn_log = []
+    # One (turn, damage, total_damage) row per turn played
+    turn_log = np.empty((51, 3), dtype=np.int32)
+    turns_logged = 0
 
     while not game.state.game_over and game.state.turn_number <= 50:
         turn_start_damage = game.state.damage_dealt
@@ -1130,30 +1641,26 @@ if __name__ == "__main__":
             pitched_count += 1
 
         # Play cards in order of damage (descending)
-        while game.state.hand:
+        hand = game.state.hand
+        while hand:
             # Find highest damage card we can afford
-            best_idx = None
-            best_damage = 0
-            for i, card in enumerate(game.state.hand):
-                if card.cost <= game.state.resources and card.damage > best_damage:
-                    best_idx = i
-                    best_damage = card.damage
-
-            if best_idx is not None:
-                game.play_card(best_idx)
-            else:
+            costs = np.fromiter((c.cost for c in hand), np.int8, count=len(hand))
+            damages = np.fromiter((c.damage for c in hand), np.int8, count=len(hand))
+            scores = np.where(costs <= game.state.resources, damages, -1)
+            best_idx = int(scores.argmax())
+            if scores[best_idx] <= 0:
                 break
+            game.play_card(best_idx)
 
         # End turn
         won = game.end_turn()
         turn_damage = game.state.damage_dealt - turn_start_damage
-        turn_log.append(
-            {
-                "turn": game.state.turn_number - 1,
-                "damage": turn_damage,
-                "total_damage": game.state.damage_dealt,
-            }
+        turn_log[turns_logged] = (
+            game.state.turn_number - 1,
+            turn_damage,
+            game.state.damage_dealt,
         )
+        turns_logged += 1
 
         if won:
             break
@@ -1164,10 +1671,13 @@ if __name__ == "__main__":
     print(f"  Target reached: {game.state.damage_dealt >= 40}")
 
     print(f"\n  Turn-by-turn breakdown (first 10 turns):")
-    for entry in turn_log[:10]:
-        print(
-            f"    Turn {entry['turn']}: +{entry['damage']} damage (total: {entry['total_damage']})"
-        )
+    for turn, damage, total_damage in turn_log[: min(10, turns_logged)]:
+        print(f"    Turn {turn}: +{damage} damage (total: {total_damage})")
+
+    # Greedy baseline over many shuffles with the compiled rollout kernel
+    print("\n[5/5] Greedy baseline (100 shuffles)...")
+    greedy_turns = evaluate_deck_greedy(sample_deck, num_runs=100, rng=game.rng)
+    print(f"  Average turns to win (or timeout): {greedy_turns:.2f}")
 
     print("\n" + "=" * 60)
     print("Phase 2 Complete!")
@@ -1275,8 +1785,8 @@ if __name__ == "__main__":
 
     # Test action selection
     print("\n[3/5] Testing action selection...")
-    action_det, _, _ = policy.get_action(test_obs, deterministic=True)
-    action_stoch, _, _ = policy.get_action(test_obs, deterministic=False)
+    action_det = policy.get_action(test_obs, deterministic=True)[0].item()
+    action_stoch = policy.get_action(test_obs, deterministic=False)[0].item()
     print(f"  Deterministic action: {action_det}")
     print(f"  Stochastic action: {action_stoch}")
     print(f"  Action in valid range: {0 <= action_det < 9 and 0 <= action_stoch < 9}")
@@ -1304,8 +1814,8 @@ if __name__ == "__main__":
 
     # Verify loaded policy works
     test_obs = env.observation_space.sample()
-    action1, _, _ = trained_policy.get_action(test_obs, deterministic=True)
-    action2, _, _ = loaded_policy.get_action(test_obs, deterministic=True)
+    action1 = trained_policy.get_action(test_obs, deterministic=True)[0].item()
+    action2 = loaded_policy.get_action(test_obs, deterministic=True)[0].item()
     print(f"  Original policy action: {action1}")
     print(f"  Loaded policy action: {action2}")
     print(f"  Actions match: {action1 == action2}")
@@ -1419,15 +1929,14 @@ if __name__ == "__main__":
     # Show deck statistics
     print(f"\n  Deck Statistics:")
     print(f"    Total cards: {len(best_deck)}")
-    print(f"    Avg damage: {np.mean([c.damage for c in best_deck]):.2f}")
-    print(f"    Avg pitch: {np.mean([c.pitch for c in best_deck]):.2f}")
-    print(f"    Avg cost: {np.mean([c.cost for c in best_deck]):.2f}")
+    avg_damage, avg_pitch, avg_cost = deck_means(best_deck)
+    print(f"    Avg damage: {avg_damage:.2f}")
+    print(f"    Avg pitch: {avg_pitch:.2f}")
+    print(f"    Avg cost: {avg_cost:.2f}")
 
     # Color distribution
-    colors = [c.color for c in best_deck]
-    color_counts = pd.Series(colors).value_counts()
     print(f"    Color distribution:")
-    for color, count in color_counts.items():
+    for color, count in zip(*color_counts(best_deck)):
         print(f"      {color}: {count} cards")
 
     print("\n" + "=" * 60)
@@ -5,15 +5,32 @@ This module integrates BDD tests with the REAL game engine components.
 The goal is to test actual engine behavior, not mock implementations.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Set
 from fab_engine.engine.precedence import PrecedenceManager, PrecedenceResult
-from fab_engine.cards.model import CardTemplate, CardInstance, Color, CardType, Subtype
+from fab_engine.cards.model import CardTemplate, CardInstance, Color
 from fab_engine.zones.zone import Zone, ZoneType
 from fab_engine.engine.game import PlayerState, GameState
 from fab_engine.cards.model import HeroState
 
 
+# Bit flags for the card-level restrictions TestPlayer checks per card
+_RESTR_RED = 1 << 0
+_RESTR_COST_3_OR_GREATER = 1 << 1
+_RESTRICTION_BITS = {
+    "cant_play_red": _RESTR_RED,
+    "cant_play_cost_3_or_greater": _RESTR_COST_3_OR_GREATER,
+}
+
+# Interned "play_from_<zone>" action identifiers, so the per-call lookup
+# doesn't format a new string each time
+_PLAY_ACTION_IDS = {
+    zone_name: sys.intern(f"play_from_{zone_name}")
+    for zone_name in ("hand", "arsenal", "banished", "arena", "pitch", "graveyard")
+}
+
+
 # NOTE: We still use a thin wrapper for Zone to match test interface
 # but it delegates to the REAL Zone class
 class TestZone:
@@ -44,6 +61,36 @@ class TestZone:
         return self._zone.contains(card)
 
 
+class _LazyAttribute:
+    """Attribute that is only created when a test first touches it.
+
+    On first access factory(instance) is stored in the instance __dict__ under
+    the same name, which shadows this descriptor for later lookups and lets
+    tests still assign their own value to the attribute.
+    """
+
+    def __init__(self, factory: Callable[[Any], Any]):
+        self.factory = factory
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        value = self.factory(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class _LazyZone(_LazyAttribute):
+    """TestPlayer zone that is only created when a test first touches it."""
+
+    def __init__(self, zone_type: ZoneType):
+        super().__init__(lambda player: TestZone(zone_type, player.player_id))
+
+
 @dataclass
 class TestAttack:
     """
@@ -54,10 +101,9 @@ class TestAttack:
     """
 
     defenders: List[Any] = field(default_factory=list)
-    keywords: List[str] = field(default_factory=list)
-    precedence: PrecedenceManager = field(
-        default_factory=PrecedenceManager
-    )  # REAL precedence
+    keywords: Set[str] = field(default_factory=set)
+    # REAL precedence, created on first use (not a dataclass field)
+    precedence = _LazyAttribute(lambda attack: PrecedenceManager())
 
     def add_restriction(self, identifier: str):
         """Add a restriction to the attack (REAL precedence system)."""
@@ -69,7 +115,7 @@ class TestAttack:
 
     def add_keyword(self, keyword: str):
         """Add a keyword to the attack."""
-        self.keywords.append(keyword)
+        self.keywords.add(keyword)
 
     def has_keyword(self, keyword: str) -> bool:
         """Check if attack has a keyword."""
@@ -86,7 +132,7 @@ class TestAttack:
         pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayResult:
     """Result of attempting to play a card."""
 
@@ -95,7 +141,7 @@ class PlayResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DefendResult:
     """Result of attempting to defend."""
 
@@ -104,7 +150,18 @@ class DefendResult:
     message: str = ""
 
 
-@dataclass
+# Results are immutable, so the fixed-message outcomes are shared instances
+_DEFEND_SUCCESS = DefendResult(success=True, message="Defense declared")
+_DEFEND_BLOCKED_BY_EQUIPMENT_RESTRICTION = DefendResult(
+    success=False,
+    blocked_by="restriction",
+    message="Attack can't be defended by equipment",
+)
+_PLAY_SUCCESS_BY_ZONE: Dict[str, PlayResult] = {}
+_PLAY_FAILURE_BY_ZONE: Dict[tuple, PlayResult] = {}
+
+
+@dataclass(frozen=True, slots=True)
 class LegalPlay:
     """Represents a legal play action."""
 
@@ -112,7 +169,7 @@ class LegalPlay:
     card: Optional[CardInstance] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RestrictionCheck:
     """Result of checking restrictions on a card."""
 
@@ -126,19 +183,22 @@ class TestPlayer:
     Uses REAL Zone objects from the game engine, with precedence system integrated.
     """
 
+    precedence = _LazyAttribute(lambda player: PrecedenceManager())  # REAL precedence
+    banished_zone = _LazyZone(ZoneType.BANISHED)
+    arsenal = _LazyZone(ZoneType.ARSENAL)
+    arena = _LazyZone(ZoneType.STACK)  # For simplicity, use STACK for arena cards
+    pitch_zone = _LazyZone(ZoneType.PITCH)  # Rule 3.14: Pitch zone
+    graveyard = _LazyZone(ZoneType.GRAVEYARD)  # Rule 3.8: Graveyard zone
+
     def __init__(self, player_id: int = 0):
         self.player_id = player_id
-        self.precedence = PrecedenceManager()  # REAL precedence system
 
-        # Use REAL Zone objects from the game engine
+        # Use REAL Zone objects from the game engine. The precedence system
+        # and the other zones are _LazyAttribute class attributes, created on
+        # first access.
         self.hand = TestZone(ZoneType.HAND, player_id)
-        self.banished_zone = TestZone(ZoneType.BANISHED, player_id)
-        self.arsenal = TestZone(ZoneType.ARSENAL, player_id)
-        self.arena = TestZone(
-            ZoneType.STACK, player_id
-        )  # For simplicity, use STACK for arena cards
-        self.pitch_zone = TestZone(ZoneType.PITCH, player_id)  # Rule 3.14: Pitch zone
-        self.graveyard = TestZone(ZoneType.GRAVEYARD, player_id)  # Rule 3.8: Graveyard zone
+        # Zones a card can be played from, built on the first play
+        self._zones: Optional[Dict[str, TestZone]] = None
 
     def add_restriction(self, identifier: str):
         """Add a restriction effect to the player."""
@@ -166,24 +226,41 @@ class TestPlayer:
 
         Checks precedence rules to determine if play is allowed.
         """
-        action_identifier = f"play_from_{zone_name}"
+        action_identifier = _PLAY_ACTION_IDS.get(zone_name) or f"play_from_{zone_name}"
         result = self.precedence.check_action(action_identifier)
 
         if not result.permitted:
-            return PlayResult(
-                success=False,
-                blocked_by=result.blocked_by,
-                message=f"Cannot play from {zone_name}",
-            )
+            key = (zone_name, result.blocked_by)
+            failure = _PLAY_FAILURE_BY_ZONE.get(key)
+            if failure is None:
+                failure = PlayResult(
+                    success=False,
+                    blocked_by=result.blocked_by,
+                    message=f"Cannot play from {zone_name}",
+                )
+                _PLAY_FAILURE_BY_ZONE[key] = failure
+            return failure
 
         # Play succeeds - move card
-        zone = getattr(
-            self, f"{zone_name}_zone" if zone_name == "banished" else zone_name
-        )
-        if card in zone:
+        zones = self._zones
+        if zones is None:
+            zones = self._zones = {
+                "hand": self.hand,
+                "arsenal": self.arsenal,
+                "banished": self.banished_zone,
+                "arena": self.arena,
+                "pitch": self.pitch_zone,
+                "graveyard": self.graveyard,
+            }
+        zone = zones.get(zone_name)
+        if zone is not None and card in zone:
             zone.remove_card(card)
 
-        return PlayResult(success=True, message=f"Played from {zone_name}")
+        result = _PLAY_SUCCESS_BY_ZONE.get(zone_name)
+        if result is None:
+            result = PlayResult(success=True, message=f"Played from {zone_name}")
+            _PLAY_SUCCESS_BY_ZONE[zone_name] = result
+        return result
 
     def attempt_defend(self, attack: TestAttack, defenders: List[Any]) -> DefendResult:
         """
@@ -191,23 +268,21 @@ class TestPlayer:
 
         Checks attack restrictions and player requirements.
         """
-        # Check if any defenders are equipment
-        has_equipment = any(
-            isinstance(d, CardInstance) and CardType.EQUIPMENT in d.template.types
-            for d in defenders
-        )
-
-        # Check attack restrictions
-        if has_equipment and attack.precedence.has_restriction(
+        # Check attack restrictions; defenders only need scanning when the
+        # attack can't be defended by equipment. An attack whose precedence
+        # was never created has no restrictions, so don't create it here.
+        precedence = attack.__dict__.get("precedence")
+        if precedence is None or not precedence.has_restriction(
             "cant_be_defended_by_equipment"
         ):
-            return DefendResult(
-                success=False,
-                blocked_by="restriction",
-                message="Attack can't be defended by equipment",
-            )
+            return _DEFEND_SUCCESS
 
-        return DefendResult(success=True, message="Defense declared")
+        # Check if any defenders are equipment
+        for d in defenders:
+            if isinstance(d, CardInstance) and d.template.is_equipment:
+                return _DEFEND_BLOCKED_BY_EQUIPMENT_RESTRICTION
+
+        return _DEFEND_SUCCESS
 
     def get_legal_plays(self) -> List[LegalPlay]:
         """
@@ -215,66 +290,65 @@ class TestPlayer:
 
         Considers precedence rules (Rule 1.0.2: Requirements > Allowances).
         """
-        legal_plays = []
-
         # Rule 1.0.2: Check for requirements first
         # If there's a requirement to play from hand, only hand cards are legal
         if self.precedence.has_requirement("must_play_next_from_hand"):
-            for card in self.hand.cards:
-                legal_plays.append(LegalPlay(source_zone="hand", card=card))
-            return legal_plays
-
-        # Check hand
-        for card in self.hand.cards:
-            result = self.precedence.check_action("play_from_hand")
-            if result.permitted:
-                legal_plays.append(LegalPlay(source_zone="hand", card=card))
-
-        # Check arsenal
-        for card in self.arsenal.cards:
-            result = self.precedence.check_action("play_from_arsenal")
-            if result.permitted:
-                legal_plays.append(LegalPlay(source_zone="arsenal", card=card))
-
-        # Check banished zone (needs allowance)
-        for card in self.banished_zone.cards:
-            result = self.precedence.check_action("play_from_banished")
-            if result.permitted:
-                legal_plays.append(LegalPlay(source_zone="banished", card=card))
-
+            return [
+                LegalPlay(source_zone="hand", card=card) for card in self.hand.cards
+            ]
+
+        # The precedence check depends only on the zone, not the card, so it
+        # is done once per zone. Banished cards need an allowance.
+        precedence = self.precedence
+        hand_ok = precedence.check_action(_PLAY_ACTION_IDS["hand"]).permitted
+        arsenal_ok = precedence.check_action(_PLAY_ACTION_IDS["arsenal"]).permitted
+        banished_ok = precedence.check_action(_PLAY_ACTION_IDS["banished"]).permitted
+
+        legal_plays = [
+            LegalPlay(source_zone="hand", card=card)
+            for card in (self.hand.cards if hand_ok else ())
+        ]
+        legal_plays += [
+            LegalPlay(source_zone="arsenal", card=card)
+            for card in (self.arsenal.cards if arsenal_ok else ())
+        ]
+        legal_plays += [
+            LegalPlay(source_zone="banished", card=card)
+            for card in (self.banished_zone.cards if banished_ok else ())
+        ]
         return legal_plays
 
-    def can_play(self, card: CardInstance) -> bool:
-        """Check if a specific card can be played."""
-        # Check color restrictions
-        if card.template.color == Color.RED and self.precedence.has_restriction(
+    def _blocking_mask(self, card: CardInstance) -> int:
+        """Return the _RESTRICTION_BITS flags of active restrictions blocking card."""
+        template = card.template
+        bits = 0
+        if template.color is Color.RED and self.precedence.has_restriction(
             "cant_play_red"
         ):
-            return False
-
-        # Check cost restrictions
-        if card.template.has_cost:
-            if card.template.cost >= 3 and self.precedence.has_restriction(
-                "cant_play_cost_3_or_greater"
-            ):
-                return False
+            bits |= _RESTR_RED
+        if (
+            template.has_cost
+            and template.cost >= 3
+            and self.precedence.has_restriction("cant_play_cost_3_or_greater")
+        ):
+            bits |= _RESTR_COST_3_OR_GREATER
+        return bits
 
-        return True
+    def can_play(self, card: CardInstance) -> bool:
+        """Check if a specific card can be played."""
+        # Color and cost restrictions
+        return self._blocking_mask(card) == 0
 
     def check_restrictions(self, card: CardInstance) -> RestrictionCheck:
         """Check which restrictions are blocking a card."""
-        blocking = []
-
-        if card.template.color == Color.RED and self.precedence.has_restriction(
-            "cant_play_red"
-        ):
-            blocking.append("cant_play_red")
-
-        if card.template.has_cost:
-            if card.template.cost >= 3 and self.precedence.has_restriction(
-                "cant_play_cost_3_or_greater"
-            ):
-                blocking.append("cant_play_cost_3_or_greater")
+        blocked = self._blocking_mask(card)
+        if not blocked:
+            return RestrictionCheck()
+        blocking = [
+            identifier
+            for identifier, bit in _RESTRICTION_BITS.items()
+            if blocked & bit
+        ]
 
         return RestrictionCheck(blocking_restrictions=blocking)
 
@@ -292,7 +366,7 @@ class TestPlayer:
 
         # Card successfully played - move to stack or arena
         if game_state:
-            if CardType.EQUIPMENT in card.template.types:
+            if card.template.is_equipment:
                 game_state.player.arena.add_card(card)
             else:
                 game_state.stack.append(card)
@@ -1,7 +1,9 @@
 """BDDGameState - the main game state class for BDD tests."""
 
+import dataclasses
+import functools
 from dataclasses import dataclass, field
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 from fab_engine.engine.precedence import PrecedenceManager, PrecedenceResult
 from fab_engine.cards.model import CardTemplate, CardInstance, Color, CardType, Subtype
 from fab_engine.zones.zone import Zone, ZoneType
@@ -35,6 +37,105 @@ from tests.bdd_helpers.stubs import (
 )
 
 
+# Color names accepted by create_card; anything else is colorless
+_COLOR_BY_NAME = {"red": Color.RED, "blue": Color.BLUE, "yellow": Color.YELLOW}
+
+# Immutable template fields shared by the BDDGameState card builders
+_EMPTY_FS = frozenset()
+_EMPTY_TUP = ()
+_ATTACK_SUBTYPES = frozenset([Subtype.ATTACK])
+_TYPES_BY_CARD_TYPE = {card_type: frozenset([card_type]) for card_type in CardType}
+_PERMANENT_SUBTYPES_BY_NAME = {
+    "aura": frozenset([Subtype.AURA]),
+    "item": frozenset([Subtype.ITEM]),
+}
+
+# Permanent subtypes (Rule 1.3.3): those already in the engine, and the names
+# tracked as card metadata until the rest are added
+_PERMANENT_SUBTYPES_ENGINE = frozenset([Subtype.AURA, Subtype.ITEM])
+_PERMANENT_SUBTYPE_NAMES = frozenset(
+    [
+        "affliction",
+        "ally",
+        "ash",
+        "aura",
+        "construct",
+        "figment",
+        "invocation",
+        "item",
+        "landmark",
+    ]
+)
+
+# Typeless colorless card with no stats; the token/resource/mentor builders
+# copy it with dataclasses.replace and only set unique_id and name
+_EMPTY_TEMPLATE = CardTemplate(
+    unique_id="",
+    name="",
+    types=_EMPTY_FS,
+    supertypes=_EMPTY_FS,
+    subtypes=_EMPTY_FS,
+    color=Color.COLORLESS,
+    pitch=0,
+    has_pitch=False,
+    cost=0,
+    has_cost=False,
+    power=0,
+    has_power=False,
+    defense=0,
+    has_defense=False,
+    arcane=0,
+    has_arcane=False,
+    life=0,
+    intellect=0,
+    keywords=_EMPTY_FS,
+    keyword_params=_EMPTY_TUP,
+    functional_text="",
+)
+
+
+# Ability types with their own functionality rule in check_ability_functional;
+# any other type (activated, static) follows the default Rule 1.7.4 checks
+_SPECIAL_FUNCTIONALITY_ABILITY_TYPES = frozenset(
+    [
+        "meta_static",
+        "property_static",
+        "zone_replacement_static",
+        "play_static",
+        "while_static",
+        "resolution",
+    ]
+)
+
+# The four asset types (Rule 1.13.1); a tuple, so callers can't mutate it
+_ASSET_TYPES = ("action_point", "resource_point", "life_point", "chi_point")
+
+# Deck-card types as per Rule 1.3.2c
+_DECK_TYPES = frozenset(
+    [CardType.ACTION, CardType.ATTACK_REACTION, CardType.DEFENSE_REACTION, CardType.INSTANT]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _category_for_types(types: frozenset) -> str:
+    """Return the card category implied by a template's types alone (Rule 1.3.2).
+
+    Metadata flags such as _is_token can be set on a card after creation, so
+    get_card_category checks those per call and only the type part is cached.
+    """
+    if CardType.HERO in types:
+        return "hero"
+    if types & _DECK_TYPES:
+        return "deck"
+    # Arena-card: not hero, not token, not deck
+    if CardType.EQUIPMENT in types or CardType.WEAPON in types:
+        return "arena"
+    # Empty types (stub) are left to get_card_category's metadata checks
+    if not types:
+        return "unknown"
+    return "arena"
+
+
 class BDDGameState:
     """
     Game state for BDD tests.
@@ -47,29 +148,38 @@ class BDDGameState:
     This ensures tests exercise actual game engine behavior.
     """
 
+    # Immutable per-scenario defaults live on the class; steps that set them
+    # shadow them with an instance attribute, so __init__ needn't store them
+
+    # Test cards
+    test_card: Optional[CardInstance] = None
+    test_card_hand: Optional[CardInstance] = None
+    test_card_arsenal: Optional[CardInstance] = None
+    test_equipment: Optional[CardInstance] = None
+    defender_card_1: Optional[CardInstance] = None
+    defender_card_2: Optional[CardInstance] = None
+    red_card: Optional[CardInstance] = None
+    blue_card: Optional[CardInstance] = None
+
+    # Results
+    play_result: Optional[PlayResult] = None
+    defend_result: Optional[DefendResult] = None
+    initial_defender_count: int = 0
+    red_playable: bool = False
+    blue_playable: bool = False
+
     def __init__(self):
         self.player = TestPlayer(player_id=0)  # REAL zones + precedence
         self.defender = TestPlayer(player_id=1)  # REAL zones + precedence
         self.attack = TestAttack()  # REAL precedence for attacks
         self.stack: List[Any] = []  # Stack for played cards
-
-        # Test cards
-        self.test_card: Optional[CardInstance] = None
-        self.test_card_hand: Optional[CardInstance] = None
-        self.test_card_arsenal: Optional[CardInstance] = None
-        self.test_equipment: Optional[CardInstance] = None
-        self.defender_card_1: Optional[CardInstance] = None
-        self.defender_card_2: Optional[CardInstance] = None
-        self.red_card: Optional[CardInstance] = None
-        self.blue_card: Optional[CardInstance] = None
-
-        # Results
-        self.play_result: Optional[PlayResult] = None
-        self.defend_result: Optional[DefendResult] = None
+        # Combat chain cards keyed by id(card), in the order they were added
+        self._combat_chain: Dict[int, CardInstance] = {}
         self.legal_plays: List[LegalPlay] = []
-        self.initial_defender_count: int = 0
-        self.red_playable: bool = False
-        self.blue_playable: bool = False
+
+        # create_card templates by (name, color, cost, card_type, defense);
+        # CardTemplate is frozen, so cards with equal properties can share one
+        self._template_cache: Dict[tuple, CardTemplate] = {}
 
     def create_card(
         self,
@@ -83,27 +193,41 @@ class BDDGameState:
         """Create a test card with specified properties."""
         # Convert string color to Color enum
         if isinstance(color, str):
-            color_lower = color.lower()
-            if color_lower == "red":
-                color = Color.RED
-            elif color_lower == "blue":
-                color = Color.BLUE
-            elif color_lower == "yellow":
-                color = Color.YELLOW
-            else:
-                color = Color.COLORLESS
+            color = _COLOR_BY_NAME.get(color.lower(), Color.COLORLESS)
 
+        key = (name, color, cost, card_type, defense)
+        template = self._template_cache.get(key)
+        if template is None:
+            template = self._build_template(name, color, cost, card_type, defense)
+            self._template_cache[key] = template
+        card = CardInstance(template=template, owner_id=owner_id)
+        return card
+
+    def _build_template(
+        self,
+        name: str,
+        color: Color,
+        cost: int,
+        card_type: CardType,
+        defense: Optional[int],
+    ) -> CardTemplate:
+        """Build the CardTemplate for create_card."""
         # Determine subtypes based on card type
-        if card_type == CardType.EQUIPMENT:
-            subtypes = frozenset()
+        if card_type is CardType.EQUIPMENT:
+            subtypes = _EMPTY_FS
         else:
-            subtypes = frozenset([Subtype.ATTACK])
+            subtypes = _ATTACK_SUBTYPES
 
-        template = CardTemplate(
+        # Some steps pass card_type as a plain string; those get their own set
+        types = _TYPES_BY_CARD_TYPE.get(card_type)
+        if types is None:
+            types = frozenset([card_type])
+
+        return CardTemplate(
             unique_id=f"test_{name}_{id(self)}",
             name=name,
-            types=frozenset([card_type]),
-            supertypes=frozenset(),
+            types=types,
+            supertypes=_EMPTY_FS,
             subtypes=subtypes,
             color=color,
             pitch=0,
@@ -118,12 +242,10 @@ class BDDGameState:
             has_arcane=False,
             life=0,
             intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
+            keywords=_EMPTY_FS,
+            keyword_params=_EMPTY_TUP,
             functional_text="",
         )
-        card = CardInstance(template=template, owner_id=owner_id)
-        return card
 
     # ===== Section 1.2: Objects helpers =====
 
@@ -155,12 +277,13 @@ class BDDGameState:
         Engine Feature Needed:
         - [ ] GameEngine.get_all_game_objects() returning cards, attacks, macros, layers
         """
-        objects = []
-        objects.extend(self.player.hand.cards)
-        objects.extend(self.player.arsenal.cards)
-        objects.extend(self.player.arena.cards)
-        objects.extend(self.stack)
-        return objects
+        player = self.player
+        return [
+            *player.hand.cards,
+            *player.arsenal.cards,
+            *player.arena.cards,
+            *self.stack,
+        ]
 
     def put_on_combat_chain(
         self,
@@ -175,15 +298,13 @@ class BDDGameState:
         - [ ] CombatChain class with chain link management (Rule 7.0)
         - [ ] CardInstance tracking of go again (Rule 1.2.3a)
         """
-        if not hasattr(self, "_combat_chain"):
-            self._combat_chain: List[Any] = []
         if power != 0:
             card.temp_power_mod = power
         if has_go_again:
             card._has_go_again = True
         elif not getattr(card, "_has_go_again", False):
             card._has_go_again = False
-        self._combat_chain.append(card)
+        self._combat_chain[id(card)] = card
         return card  # Return card as chain link reference
 
     def remove_from_combat_chain(self, card: CardInstance) -> Any:
@@ -194,10 +315,7 @@ class BDDGameState:
         - [ ] CombatChain.remove_card() returning LastKnownInformation (Rule 1.2.3)
         - [ ] LastKnownInformation class with snapshot semantics
         """
-        if not hasattr(self, "_combat_chain"):
-            self._combat_chain = []
-        if card in self._combat_chain:
-            self._combat_chain.remove(card)
+        self._combat_chain.pop(id(card), None)
         # Return a simple LKI stub - engine must implement proper LKI
         return LastKnownInformationStub(card)
 
@@ -208,10 +326,15 @@ class BDDGameState:
         This simulates the Endless Arrow example: card moves to hand, but
         chain link uses LKI to determine resolution behavior.
 
+        Cards moved off the stack rather than the combat chain still get LKI.
+
         Engine Feature Needed:
         - [ ] ChainLink LKI capture during card removal (Rule 1.2.3a)
         """
-        lki = self.remove_from_combat_chain(card)
+        if id(card) in self._combat_chain:
+            lki = self.remove_from_combat_chain(card)
+        else:
+            lki = LastKnownInformationStub(card)
         self.player.hand.add_card(card)
         return lki
 
@@ -241,7 +364,7 @@ class BDDGameState:
         - [ ] TargetingSystem.validate_target() rejecting LKI (Rule 1.2.3d)
         """
         # LKI objects are not legal targets
-        if isinstance(obj, LastKnownInformationStub):
+        if getattr(obj, "is_last_known_information", False):
             return TargetingResultStub(success=False, reason="lki_not_legal_target")
         return TargetingResultStub(success=True, reason="valid_target")
 
@@ -295,28 +418,11 @@ class BDDGameState:
         - [ ] CardType.TOKEN enum value (Rule 1.3.2b)
         """
         # TOKEN type not yet in engine - use a stub approach
-        template = CardTemplate(
+        template = dataclasses.replace(
+            _EMPTY_TEMPLATE,
             unique_id=f"token_{name}_{id(self)}",
             name=name,
-            types=frozenset(),  # Will need frozenset([CardType.TOKEN]) when implemented
-            supertypes=frozenset(),
-            subtypes=frozenset(),
-            color=Color.COLORLESS,
-            pitch=0,
-            has_pitch=False,
-            cost=0,
-            has_cost=False,
-            power=0,
-            has_power=False,
-            defense=0,
-            has_defense=False,
-            arcane=0,
-            has_arcane=False,
-            life=0,
-            intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
-            functional_text="",
+            # types will need frozenset([CardType.TOKEN]) when implemented
         )
         card = CardInstance(template=template, owner_id=owner_id)
         # Mark as token via metadata until engine supports CardType.TOKEN
@@ -332,28 +438,11 @@ class BDDGameState:
         Engine Feature Needed:
         - [ ] CardType.RESOURCE enum value (Rule 1.3.2c)
         """
-        template = CardTemplate(
+        template = dataclasses.replace(
+            _EMPTY_TEMPLATE,
             unique_id=f"resource_{name}_{id(self)}",
             name=name,
-            types=frozenset(),  # Will need frozenset([CardType.RESOURCE]) when implemented
-            supertypes=frozenset(),
-            subtypes=frozenset(),
-            color=Color.COLORLESS,
-            pitch=0,
-            has_pitch=False,
-            cost=0,
-            has_cost=False,
-            power=0,
-            has_power=False,
-            defense=0,
-            has_defense=False,
-            arcane=0,
-            has_arcane=False,
-            life=0,
-            intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
-            functional_text="",
+            # types will need frozenset([CardType.RESOURCE]) when implemented
         )
         card = CardInstance(template=template, owner_id=owner_id)
         card._is_resource = True  # type: ignore[attr-defined]
@@ -368,28 +457,11 @@ class BDDGameState:
         Engine Feature Needed:
         - [ ] CardType.MENTOR enum value (Rule 1.3.2c)
         """
-        template = CardTemplate(
+        template = dataclasses.replace(
+            _EMPTY_TEMPLATE,
             unique_id=f"mentor_{name}_{id(self)}",
             name=name,
-            types=frozenset(),  # Will need frozenset([CardType.MENTOR]) when implemented
-            supertypes=frozenset(),
-            subtypes=frozenset(),
-            color=Color.COLORLESS,
-            pitch=0,
-            has_pitch=False,
-            cost=0,
-            has_cost=False,
-            power=0,
-            has_power=False,
-            defense=0,
-            has_defense=False,
-            arcane=0,
-            has_arcane=False,
-            life=0,
-            intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
-            functional_text="",
+            # types will need frozenset([CardType.MENTOR]) when implemented
         )
         card = CardInstance(template=template, owner_id=owner_id)
         card._is_mentor = True  # type: ignore[attr-defined]
@@ -408,26 +480,16 @@ class BDDGameState:
         - [ ] Subtype.ALLY, AFFLICTION, ASH, AURA, CONSTRUCT, FIGMENT, INVOCATION,
                ITEM, LANDMARK enum values (Rule 1.3.3)
         """
-        # Check if subtype is already in engine
-        permanent_subtypes_engine = {
-            Subtype.AURA,
-            Subtype.ITEM,
-        }
-        # Map name to engine Subtype if available
+        # Map name to engine Subtype if available; subtypes not yet in
+        # engine are tracked as metadata
         subtype_lower = subtype.lower()
-        if subtype_lower == "aura":
-            subtypes_set = frozenset([Subtype.AURA])
-        elif subtype_lower == "item":
-            subtypes_set = frozenset([Subtype.ITEM])
-        else:
-            # Subtype not yet in engine - track as metadata
-            subtypes_set = frozenset()
+        subtypes_set = _PERMANENT_SUBTYPES_BY_NAME.get(subtype_lower, _EMPTY_FS)
 
         template = CardTemplate(
             unique_id=f"permanent_{name}_{id(self)}",
             name=name,
-            types=frozenset([CardType.ACTION]),
-            supertypes=frozenset(),
+            types=_TYPES_BY_CARD_TYPE[CardType.ACTION],
+            supertypes=_EMPTY_FS,
             subtypes=subtypes_set,
             color=Color.COLORLESS,
             pitch=0,
@@ -442,8 +504,8 @@ class BDDGameState:
             has_arcane=False,
             life=0,
             intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
+            keywords=_EMPTY_FS,
+            keyword_params=_EMPTY_TUP,
             functional_text="",
         )
         card = CardInstance(template=template, owner_id=owner_id)
@@ -461,9 +523,9 @@ class BDDGameState:
         template = CardTemplate(
             unique_id=f"distinct_{name}_{pitch}_{id(self)}",
             name=name,
-            types=frozenset([CardType.ACTION]),
-            supertypes=frozenset(),
-            subtypes=frozenset([Subtype.ATTACK]),
+            types=_TYPES_BY_CARD_TYPE[CardType.ACTION],
+            supertypes=_EMPTY_FS,
+            subtypes=_ATTACK_SUBTYPES,
             color=Color.COLORLESS,
             pitch=pitch,
             has_pitch=True,
@@ -477,8 +539,8 @@ class BDDGameState:
             has_arcane=False,
             life=0,
             intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
+            keywords=_EMPTY_FS,
+            keyword_params=_EMPTY_TUP,
             functional_text="",
         )
         return CardInstance(template=template, owner_id=owner_id)
@@ -491,46 +553,30 @@ class BDDGameState:
         - [ ] CardTemplate.get_category() -> str returning the card category
         - [ ] CardType.TOKEN, RESOURCE, MENTOR, BLOCK enum values
         """
+        template = card.template
+
         # Delegate to engine if implemented
-        if hasattr(card.template, "get_category"):
-            return card.template.get_category()
+        if hasattr(template, "get_category"):
+            return template.get_category()
 
         # Fallback logic using current engine types
-        if CardType.HERO in card.template.types:
+        type_category = _category_for_types(template.types)
+        if type_category == "hero":
             return "hero"
 
+        # Metadata flags are plain instance attributes set by the create_*
+        # helpers or by steps, so read them from the instance dict
+        metadata = card.__dict__
+
         # TOKEN check - engine doesn't have CardType.TOKEN yet
-        if getattr(card, "_is_token", False):
+        if metadata.get("_is_token", False):
             return "token"
 
-        # Deck-card types as per Rule 1.3.2c
-        deck_types = {
-            CardType.ACTION,
-            CardType.ATTACK_REACTION,
-            CardType.DEFENSE_REACTION,
-            CardType.INSTANT,
-        }
         # Resource, Mentor, Block not yet in engine - check via metadata
-        if getattr(card, "_is_resource", False):
-            return "deck"
-        if getattr(card, "_is_mentor", False):
+        if metadata.get("_is_resource", False) or metadata.get("_is_mentor", False):
             return "deck"
 
-        if card.template.types & deck_types:
-            return "deck"
-
-        # Arena-card: not hero, not token, not deck
-        if (
-            CardType.EQUIPMENT in card.template.types
-            or CardType.WEAPON in card.template.types
-        ):
-            return "arena"
-
-        # If types are empty (stub), check metadata
-        if not card.template.types:
-            return "unknown"
-
-        return "arena"
+        return type_category
 
     def can_start_in_deck(self, card: CardInstance) -> bool:
         """
@@ -596,24 +642,10 @@ class BDDGameState:
         # Deck cards: only with permanent subtypes
         if category == "deck":
             # Check engine-known permanent subtypes
-            permanent_subtypes_engine = {Subtype.AURA, Subtype.ITEM}
-            if card.template.subtypes & permanent_subtypes_engine:
+            if not card.template.subtypes.isdisjoint(_PERMANENT_SUBTYPES_ENGINE):
                 return True
             # Check metadata-tracked subtypes (for engine types not yet implemented)
-            perm_subtype = getattr(card, "_permanent_subtype", None)
-            if perm_subtype in {
-                "affliction",
-                "ally",
-                "ash",
-                "aura",
-                "construct",
-                "figment",
-                "invocation",
-                "item",
-                "landmark",
-            }:
-                return True
-            return False
+            return getattr(card, "_permanent_subtype", None) in _PERMANENT_SUBTYPE_NAMES
 
         return False
 
@@ -711,29 +743,30 @@ class BDDGameState:
 
         Reference: Rules 1.7.4 through 1.7.4j
         """
-        # Meta-static: always functional outside game
-        if ability_type == "meta_static":
-            return True  # Rule 1.7.4d
+        # Activated and plain static abilities skip straight to the default rules
+        if ability_type in _SPECIAL_FUNCTIONALITY_ABILITY_TYPES:
+            # Meta-static: always functional outside game
+            if ability_type == "meta_static":
+                return True  # Rule 1.7.4d
 
-        # Property-static: functional in any zone or outside game
-        if ability_type == "property_static":
-            return True  # Rule 1.7.4f
+            # Property-static: functional in any zone or outside game
+            if ability_type == "property_static":
+                return True  # Rule 1.7.4f
 
-        # Zone-movement replacement static: functional when destination matches
-        if ability_type == "zone_replacement_static":
-            replacement_from = getattr(card, "zone_replacement_from", None)
-            return destination_zone == replacement_from  # Rule 1.7.4j
+            # Zone-movement replacement static: functional when destination matches
+            if ability_type == "zone_replacement_static":
+                replacement_from = getattr(card, "zone_replacement_from", None)
+                return destination_zone == replacement_from  # Rule 1.7.4j
 
-        # Play-static: functional when source is public and being played
-        if ability_type == "play_static":
-            return is_public and is_being_played  # Rule 1.7.4e
+            # Play-static: functional when source is public and being played
+            if ability_type == "play_static":
+                return is_public and is_being_played  # Rule 1.7.4e
 
-        # While-static: functional when while-condition is met
-        if ability_type == "while_static":
-            return while_condition_met  # Rule 1.7.4g
+            # While-static: functional when while-condition is met
+            if ability_type == "while_static":
+                return while_condition_met  # Rule 1.7.4g
 
-        # Resolution ability: functional only when resolving on the stack
-        if ability_type == "resolution":
+            # Resolution ability: functional only when resolving on the stack
             return is_resolving  # Rule 1.7.4c
 
         # Default (activated / static): functional when source is public and in arena
@@ -760,15 +793,16 @@ class BDDGameState:
         - [ ] ResolutionResult.effects_generated list
         """
         if not self.stack:
-            return ResolutionResultStub(effects_generated=[])
+            return ResolutionResultStub()
         top = self.stack.pop()
         # Simulate resolution abilities generating effects
-        effects = []
-        if hasattr(top, "resolution_abilities"):
-            effects.extend(top.resolution_abilities)
-        elif hasattr(top, "functional_text"):
-            effects.append(top.functional_text)
-        return ResolutionResultStub(effects_generated=effects)
+        resolution_abilities = getattr(top, "resolution_abilities", None)
+        if resolution_abilities is not None:
+            return ResolutionResultStub(effects_generated=list(resolution_abilities))
+        functional_text = getattr(top, "functional_text", None)
+        if functional_text is not None:
+            return ResolutionResultStub(effects_generated=[functional_text])
+        return ResolutionResultStub()
 
     def declare_modal_modes(self, card: CardInstance, modes: List[str]) -> Any:
         """
@@ -799,8 +833,6 @@ class BDDGameState:
                 requires_distinct_modes=False,
             )
         # Mode selection is valid - set selected modes
-        if not hasattr(card, "selected_modes"):
-            card.selected_modes = []  # type: ignore[attr-defined]
         card.selected_modes = modes  # type: ignore[attr-defined]
         return ModalModeResultStub(
             success=True, reason="valid", requires_distinct_modes=False
@@ -874,13 +906,14 @@ class BDDGameState:
         - [ ] Effect.modify_ability(card, old, new) (Rule 1.7.7)
         - [ ] CardInstance.abilities mutation tracking
         """
-        if not hasattr(card, "abilities"):
+        abilities = getattr(card, "abilities", None)
+        if abilities is None:
             return AbilityModificationResultStub(
                 success=False, original_ability_replaced=False
             )
-        if old_ability in card.abilities:
-            card.abilities.remove(old_ability)
-            card.abilities.append(new_ability)
+        if old_ability in abilities:
+            abilities.remove(old_ability)
+            abilities.append(new_ability)
             return AbilityModificationResultStub(
                 success=True, original_ability_replaced=True
             )
@@ -927,8 +960,9 @@ class BDDGameState:
         - [ ] Including optional and conditional effects in the check
         """
         # Engine Feature Needed: has_effect() on CardInstance
-        if hasattr(card, "has_effect"):
-            return card.has_effect(effect_type)
+        has_effect = getattr(card, "has_effect", None)
+        if has_effect is not None:
+            return has_effect(effect_type)
         # Fallback: check metadata set in tests
         if effect_type == "deal_damage":
             return getattr(card, "_has_deal_damage_effect", False)
@@ -1008,8 +1042,9 @@ class BDDGameState:
         - [ ] CardLayer.require_target_declaration_on_play() (Rule 1.8.5)
         """
         # Engine Feature Needed: TargetedEffect.requires_declaration_at_play
-        if hasattr(card, "_has_targeted_effect"):
-            return card._has_targeted_effect
+        has_targeted_effect = getattr(card, "_has_targeted_effect", None)
+        if has_targeted_effect is not None:
+            return has_targeted_effect
         # If card functional text contains "target", it requires declaration
         func_text = getattr(card, "functional_text", "") or ""
         return (
@@ -1066,7 +1101,7 @@ class BDDGameState:
 
     # ===== Section 1.13: Assets helpers =====
 
-    def get_asset_types(self) -> List[str]:
+    def get_asset_types(self) -> Tuple[str, ...]:
         """
         Return the four asset types in the game (Rule 1.13.1).
 
@@ -1074,7 +1109,7 @@ class BDDGameState:
         - [ ] AssetType enum with ACTION_POINT, RESOURCE_POINT, LIFE_POINT, CHI_POINT
         - [ ] GameEngine.get_asset_types() returning all valid asset types
         """
-        return ["action_point", "resource_point", "life_point", "chi_point"]
+        return _ASSET_TYPES
 
     def set_player_action_points(self, player: Any, amount: int) -> None:
         """
@@ -1112,6 +1147,18 @@ class BDDGameState:
         self.set_player_action_points(player, current - 1)
         return AssetSpendResultStub(success=True)
 
+    def _grant_action_points_in_phase(self, player: Any, amount: int) -> int:
+        """
+        Grant action points if the player is in their action phase (Rule 1.13.2b).
+
+        Returns the number of action points granted (0 outside the action phase).
+        """
+        if not getattr(player, "_in_action_phase", False):
+            return 0
+        current = self.get_player_action_points(player)
+        self.set_player_action_points(player, current + amount)
+        return amount
+
     def begin_action_phase_for_player(self, player: Any) -> None:
         """
         Begin the action phase for a player, granting 1 action point (Rule 1.13.2a).
@@ -1122,9 +1169,7 @@ class BDDGameState:
         """
         # Delegate to engine when implemented
         # Engine Feature Needed: GameEngine.begin_action_phase()
-        current = self.get_player_action_points(player)
-        if getattr(player, "_in_action_phase", False):
-            self.set_player_action_points(player, current + 1)
+        self._grant_action_points_in_phase(player, 1)
 
     def trigger_go_again_for_player(self, player: Any) -> None:
         """
@@ -1135,9 +1180,7 @@ class BDDGameState:
         - [ ] Action phase guard: does not fire outside action phase (Rule 1.13.2b)
         """
         # Only grant if in action phase (Rule 1.13.2b)
-        if getattr(player, "_in_action_phase", False):
-            current = self.get_player_action_points(player)
-            self.set_player_action_points(player, current + 1)
+        self._grant_action_points_in_phase(player, 1)
 
     def grant_action_points_via_effect(self, player: Any, amount: int) -> None:
         """
@@ -1148,9 +1191,7 @@ class BDDGameState:
         - [ ] Guard: blocked outside action phase (Rule 1.13.2b)
         """
         # Only grant if in action phase (Rule 1.13.2b)
-        if getattr(player, "_in_action_phase", False):
-            current = self.get_player_action_points(player)
-            self.set_player_action_points(player, current + amount)
+        self._grant_action_points_in_phase(player, amount)
 
     def simulate_instant_play_with_go_again(self, player: Any) -> None:
         """
@@ -1265,9 +1306,9 @@ class BDDGameState:
         template = CardTemplate(
             unique_id=f"pitch_{name}_{id(self)}",
             name=name,
-            types=frozenset([CardType.ACTION]),
-            supertypes=frozenset(),
-            subtypes=frozenset([Subtype.ATTACK]),
+            types=_TYPES_BY_CARD_TYPE[CardType.ACTION],
+            supertypes=_EMPTY_FS,
+            subtypes=_ATTACK_SUBTYPES,
             color=Color.COLORLESS,
             pitch=pitch_value,
             has_pitch=True,
@@ -1281,8 +1322,8 @@ class BDDGameState:
             has_arcane=False,
             life=0,
             intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
+            keywords=_EMPTY_FS,
+            keyword_params=_EMPTY_TUP,
             functional_text="",
         )
         card = CardInstance(template=template, owner_id=owner_id)
@@ -1297,13 +1338,11 @@ class BDDGameState:
         - [ ] PitchAction.execute(player_id, card) generating assets (Rule 1.14.3)
         - [ ] PitchResult with asset_type and amount
         """
-        pitch_generates = getattr(card, "_pitch_generates", "resource")
-        pitch_value = card.template.pitch
-
-        if pitch_generates != "resource":
+        if getattr(card, "_pitch_generates", "resource") != "resource":
             return PitchPaymentResultStub(
                 resources_gained=0, pitch_event_occurred=False
             )
+        pitch_value = card.template.pitch
 
         # Move card to pitch zone
         if card in player.hand:
@@ -1358,11 +1397,9 @@ class BDDGameState:
         Engine Feature Needed:
         - [ ] PitchAction.execute_for_chi(player_id, card) (Rule 1.13.5a)
         """
-        pitch_generates = getattr(card, "_pitch_generates", "resource")
-        pitch_value = card.template.pitch
-
-        if pitch_generates != "chi":
+        if getattr(card, "_pitch_generates", "resource") != "chi":
             return PitchAttemptResultStub(pitch_succeeded=False, pitch_rejected=True)
+        pitch_value = card.template.pitch
 
         # Move card to pitch zone (note: TestZone may not have the card in a zone already)
         try:
@@ -1555,15 +1592,12 @@ class BDDGameState:
         - [ ] NonAttackGoAgainResult.go_again_was_last flag
         """
         has_go_again = getattr(card, "_has_go_again", False)
-        in_action_phase = getattr(player, "_in_action_phase", False)
 
         action_points_granted = 0
         go_again_was_last = has_go_again  # go again always resolves last if present
 
-        if has_go_again and in_action_phase:
-            current = self.get_player_action_points(player)
-            self.set_player_action_points(player, current + 1)
-            action_points_granted = 1
+        if has_go_again:
+            action_points_granted = self._grant_action_points_in_phase(player, 1)
 
         return NonAttackGoAgainResolutionResultStub(
             go_again_was_last=go_again_was_last,
@@ -1581,8 +1615,6 @@ class BDDGameState:
         - [ ] ChainLink.had_go_again via LKI when attack off chain (Rule 7.6.2a)
         - [ ] ResolutionStepResult with action_points_granted and used_last_known_information
         """
-        in_action_phase = getattr(player, "_in_action_phase", False)
-
         # Determine if go again applies — check chain link or its LKI
         used_lki = False
         has_go_again = False
@@ -1590,7 +1622,7 @@ class BDDGameState:
         if chain_link is None:
             # No chain link at all — no go again
             pass
-        elif isinstance(chain_link, LastKnownInformationStub):
+        elif getattr(chain_link, "is_last_known_information", False):
             # Chain link has been removed; use LKI
             used_lki = True
             has_go_again = getattr(chain_link, "had_go_again", False)
@@ -1603,10 +1635,8 @@ class BDDGameState:
                 has_go_again = getattr(chain_link, "_has_go_again", False)
 
         action_points_granted = 0
-        if has_go_again and in_action_phase:
-            current = self.get_player_action_points(player)
-            self.set_player_action_points(player, current + 1)
-            action_points_granted = 1
+        if has_go_again:
+            action_points_granted = self._grant_action_points_in_phase(player, 1)
 
         return ResolutionStepResultStub(
             action_points_granted=action_points_granted,
@@ -1650,14 +1680,11 @@ class BDDGameState:
         - [ ] GoAgainResolver.evaluate_from_lki(lki, player) (Rule 5.3.5a)
         - [ ] LastKnownInformation.had_go_again snapshot used (Rule 1.2.3a)
         """
-        in_action_phase = getattr(player, "_in_action_phase", False)
         had_go_again = getattr(lki, "had_go_again", False)
 
         action_points_granted = 0
-        if had_go_again and in_action_phase:
-            current = self.get_player_action_points(player)
-            self.set_player_action_points(player, current + 1)
-            action_points_granted = 1
+        if had_go_again:
+            action_points_granted = self._grant_action_points_in_phase(player, 1)
 
         return GoAgainLKIEvaluationResultStub(
             used_last_known_information=True,
@@ -1696,9 +1723,9 @@ class BDDGameState:
         template = CardTemplate(
             unique_id=f"cost_{name}_{id(self)}",
             name=name,
-            types=frozenset([CardType.ACTION]),
-            supertypes=frozenset(),
-            subtypes=frozenset([Subtype.ATTACK]),
+            types=_TYPES_BY_CARD_TYPE[CardType.ACTION],
+            supertypes=_EMPTY_FS,
+            subtypes=_ATTACK_SUBTYPES,
             color=Color.COLORLESS,
             pitch=0,
             has_pitch=False,
@@ -1712,8 +1739,8 @@ class BDDGameState:
             has_arcane=False,
             life=0,
             intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
+            keywords=_EMPTY_FS,
+            keyword_params=_EMPTY_TUP,
             functional_text="",
         )
         card = CardInstance(template=template, owner_id=owner_id)
@@ -1735,9 +1762,9 @@ class BDDGameState:
         template = CardTemplate(
             unique_id=f"chi_pitch_{name}_{id(self)}",
             name=name,
-            types=frozenset([CardType.ACTION]),
-            supertypes=frozenset(),
-            subtypes=frozenset([Subtype.ATTACK]),
+            types=_TYPES_BY_CARD_TYPE[CardType.ACTION],
+            supertypes=_EMPTY_FS,
+            subtypes=_ATTACK_SUBTYPES,
             color=Color.COLORLESS,
             pitch=chi_value,
             has_pitch=True,
@@ -1751,8 +1778,8 @@ class BDDGameState:
             has_arcane=False,
             life=0,
             intellect=0,
-            keywords=frozenset(),
-            keyword_params=tuple(),
+            keywords=_EMPTY_FS,
+            keyword_params=_EMPTY_TUP,
             functional_text="",
         )
         card = CardInstance(template=template, owner_id=owner_id)
@@ -2438,8 +2465,9 @@ class BDDGameState:
         - [ ] Dynamic supertypes tracking (gain/lose via Rule 2.11.5)
         """
         # First check for test metadata (dynamic supertypes)
-        if hasattr(card, "_supertypes"):
-            return card._supertypes
+        supertypes = getattr(card, "_supertypes", None)
+        if supertypes is not None:
+            return supertypes
         # Fall back to template supertypes
         if hasattr(card, "template") and hasattr(card.template, "supertypes"):
             return {s.name.title() for s in card.template.supertypes}
@@ -2661,16 +2689,18 @@ class BDDGameState:
         - [ ] CardTemplate.is_distinct_from(other) method
         - [ ] Multi-face card support (Rule 9.1: double-faced cards)
         """
-        if hasattr(card_a.template, "is_distinct_from"):
-            return card_a.template.is_distinct_from(card_b.template)
+        template_a = card_a.template
+        template_b = card_b.template
+        if hasattr(template_a, "is_distinct_from"):
+            return template_a.is_distinct_from(template_b)
 
         # Simple single-face comparison: name or pitch differs
-        name_differs = card_a.template.name != card_b.template.name
+        name_differs = template_a.name != template_b.name
         pitch_differs = (
-            card_a.template.has_pitch
-            and card_b.template.has_pitch
-            and card_a.template.pitch != card_b.template.pitch
-        ) or (card_a.template.has_pitch != card_b.template.has_pitch)
+            template_a.has_pitch
+            and template_b.has_pitch
+            and template_a.pitch != template_b.pitch
+        ) or (template_a.has_pitch != template_b.has_pitch)
 
         return name_differs or pitch_differs
 
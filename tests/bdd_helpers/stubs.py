@@ -17,6 +17,15 @@ class LastKnownInformationStub:
     - [ ] Not a legal target (Rule 1.2.3d)
     """
 
+    __slots__ = (
+        "_card",
+        "name",
+        "power",
+        "temp_power_mod",
+        "had_go_again",
+        "is_last_known_information",
+    )
+
     def __init__(self, card: CardInstance):
         # Snapshot the card's state at the time of creation
         self._card = card
@@ -40,6 +49,8 @@ class ModificationResultStub:
     - [ ] Modification attempt result with failed/was_noop flags
     """
 
+    __slots__ = ("failed", "was_noop")
+
     def __init__(self, failed: bool = False, was_noop: bool = False):
         self.failed = failed
         self.was_noop = was_noop
@@ -53,6 +64,8 @@ class TargetingResultStub:
     - [ ] TargetingResult with success/reason attributes
     """
 
+    __slots__ = ("success", "reason")
+
     def __init__(self, success: bool, reason: str = ""):
         self.success = success
         self.reason = reason
@@ -80,6 +93,8 @@ class SourceValidationResultStub:
     - [ ] SourceValidationResult with is_valid attribute
     """
 
+    __slots__ = ("is_valid",)
+
     def __init__(self, is_valid: bool):
         self.is_valid = is_valid
 
@@ -92,6 +107,8 @@ class PreventionEffectStub:
     - [ ] PreventionEffect with source card/macro reference
     """
 
+    __slots__ = ("source",)
+
     def __init__(self, source: CardInstance):
         self.source = source
 
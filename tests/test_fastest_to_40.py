@@ -0,0 +1,67 @@
+"""
+Tests for the greedy rollout kernel in fastest_to_40.py.
+"""
+
+import numpy as np
+import pytest
+from fastest_to_40 import Card, GameEngine, _rollout_greedy, deck_stats_array
+
+
+def make_deck(rng: np.random.Generator, size: int = 40):
+    """Create a random deck of playable cards."""
+    return [
+        Card(
+            name=f"Card {i}",
+            pitch=int(rng.integers(1, 4)),
+            cost=int(rng.integers(0, 4)),
+            damage=int(rng.integers(0, 7)),
+            color="Colorless",
+        )
+        for i in range(size)
+    ]
+
+
+def play_greedy_with_engine(engine: GameEngine, max_turns: int = 50):
+    """Play the kernel's greedy strategy through GameEngine.
+
+    Each turn pitches the first card in hand twice, then plays the
+    highest-damage affordable card until none is left.
+    """
+    state = engine.state
+    while state.turn_number <= max_turns:
+        for _ in range(2):
+            if state.hand:
+                engine.pitch_card(0)
+
+        while True:
+            best_idx, best_damage = -1, 0
+            for i, card in enumerate(state.hand):
+                if card.cost <= state.resources and card.damage > best_damage:
+                    best_idx, best_damage = i, card.damage
+            if best_idx < 0:
+                break
+            engine.play_card(best_idx)
+
+        if engine.end_turn() or state.game_over:
+            break
+
+    return state.turn_number, state.damage_dealt
+
+
+class TestRolloutGreedy:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_game_engine(self, seed):
+        """_rollout_greedy plays the same game as GameEngine."""
+        deck = make_deck(np.random.default_rng(seed))
+        engine = GameEngine(deck)
+        engine.reset(seed=seed)
+        deck_perm = engine._deck_indices.astype(np.int64)
+
+        turns, damage = play_greedy_with_engine(engine)
+        kernel_turns, kernel_damage, turn_damage = _rollout_greedy(
+            deck_stats_array(deck).astype(np.int64), deck_perm
+        )
+
+        assert kernel_turns == turns
+        assert kernel_damage == damage
+        assert turn_damage.sum() == damage